@@ -1,12 +1,18 @@
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
-import matplotlib.font_manager as fm
+import functools
+import hashlib
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from mlip_color_map import get_model_colors
 
+
+@functools.lru_cache(maxsize=8)
+def _cached_colors(names_tuple, exclude_matlantis):
+    """Resolve palette colors once per distinct model list."""
+    return get_model_colors(list(names_tuple), exclude_matlantis=exclude_matlantis)
+
 # List of MLIP models
 MLIP_models = [
     "AlphaNet",
@@ -41,33 +47,70 @@ MLIP_names = [
     "UMA-m",
 ]
 
-# Unique color per model pulled from the centralized palette
-colors, _ = get_model_colors(MLIP_names, exclude_matlantis=True)
-
 # Path to the Excel source
 excel_path = "/home/jumoon/01_research/01_2025/14_catbench_revision/12_figures/03_figure3/00_mamun_Benchmarking_Analysis_0812.xlsx"
 
-# Load the Excel sheet
-df = pd.read_excel(excel_path, sheet_name='MLIP_Data')
-
-# Prepare containers
-MAE_normal = []
-Time_per_step = []
-normal_ratio = []
+# Rendered figures and the stamp recording the inputs they were drawn from
+figure_outputs = {
+    'b/.figure3b.stamp': ['b/figure3b.png', 'b/figure3b_ticks.png'],
+    'c/.figure3c.stamp': ['c/figure3c.png', 'c/figure3c_ticks.png'],
+}
+
+def input_stamp():
+    """Hash the inputs the figures depend on: the xlsx, the model lists, and this script."""
+    xlsx = os.stat(excel_path)
+    script = os.stat(os.path.abspath(__file__))
+    key = (xlsx.st_mtime_ns, xlsx.st_size, tuple(MLIP_models), tuple(MLIP_names), script.st_mtime_ns)
+    return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+def figures_up_to_date(stamp):
+    """Return True if every figure exists and its stamp matches the current inputs."""
+    for stamp_path, pngs in figure_outputs.items():
+        if not all(os.path.exists(png) for png in pngs):
+            return False
+        try:
+            with open(stamp_path) as f:
+                if f.read().strip() != stamp:
+                    return False
+        except OSError:
+            return False
+    return True
+
+# Columns needed from the MLIP_Data sheet
+mlip_data_columns = ['MLIP_name', 'MAE_normal (eV)', 'Time_per_step (s)', 'Normal ratio (%)']
+
+def load_mlip_data(excel_path):
+    """Load the MLIP_Data sheet, reusing a Feather copy while it is newer than the xlsx."""
+    import pandas as pd
+
+    cache_path = excel_path + '.feather'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(excel_path):
+        return pd.read_feather(cache_path)
+
+    try:
+        import python_calamine  # noqa: F401  (Rust reader, much faster than openpyxl)
+        engine = 'calamine'
+    except ImportError:
+        engine = 'openpyxl'
+    df = pd.read_excel(excel_path, sheet_name='MLIP_Data', usecols=mlip_data_columns, engine=engine)
+    try:
+        df.reset_index(drop=True).to_feather(cache_path)
+    except (ImportError, OSError):
+        # Feather needs pyarrow and a writable source directory; run uncached otherwise
+        pass
+    return df
+
+# Helvetica font used for every figure
+font_path = "/home/jumoon/fonts/Helvetica.ttf"
 
-# Extract metrics for each MLIP
-for model in MLIP_models:
-    model_data = df[df['MLIP_name'] == model]
-    if len(model_data) > 0:
-        MAE_normal.append(float(model_data['MAE_normal (eV)'].values[0]))
-        Time_per_step.append(float(model_data['Time_per_step (s)'].values[0]))
-        normal_ratio.append(float(model_data['Normal ratio (%)'].values[0]))
+def setup_fonts():
+    """Register and select Helvetica; call once per process before creating figures."""
+    import matplotlib
+    import matplotlib.font_manager as fm
 
-# Configure Helvetica font
-font_path = "/home/jumoon/fonts/Helvetica.ttf"
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Helvetica']
-fm.fontManager.addfont(font_path)
+    matplotlib.rcParams['font.family'] = 'sans-serif'
+    matplotlib.rcParams['font.sans-serif'] = ['Helvetica']
+    fm.fontManager.addfont(font_path)
 
 # Typography settings
 label_size = 50
@@ -75,77 +118,233 @@ tick_size = 50
 annotation_size = 36  # large labels for model names
 label_pad = 15
 marker_size = 1200  # oversized markers for readability
+ticks_dpi = 150  # ticks-only companions; their tick labels render at half resolution
 
 def find_pareto_frontier(x_values, y_values, minimize_x=True, minimize_y=True):
-    """Find the Pareto frontier."""
-    points = np.column_stack((x_values, y_values))
-    pareto_indices = []
-    
-    for i in range(len(points)):
-        is_pareto = True
-        for j in range(len(points)):
-            if i != j:
-                if minimize_x and minimize_y:
-                    if (points[j][0] <= points[i][0] and points[j][1] <= points[i][1] and 
-                        (points[j][0] < points[i][0] or points[j][1] < points[i][1])):
-                        is_pareto = False
-                        break
-                elif minimize_x and not minimize_y:
-                    if (points[j][0] <= points[i][0] and points[j][1] >= points[i][1] and 
-                        (points[j][0] < points[i][0] or points[j][1] > points[i][1])):
-                        is_pareto = False
-                        break
-        if is_pareto:
-            pareto_indices.append(i)
-    
-    return pareto_indices
-
-def adjust_label_positions(x_vals, y_vals, names, y_range):
-    """Adjust label offsets in both axes to reduce overlap.
+    """Find the Pareto frontier.
+
+    Sorts once on x and sweeps while tracking the best y seen so far, so the
+    returned indices are already ordered by ascending x.
+    """
+    x = np.asarray(x_values, dtype=float)
+    y = np.asarray(y_values, dtype=float)
+    if not minimize_x:
+        return np.argsort(x, kind='stable').tolist()
+
+    # Compare on a key where smaller is always better
+    y_key = y if minimize_y else -y
+    order = np.lexsort((y_key, x))
+
+    _jit_kernels()
+    return _pareto_sweep(x, y_key, order).tolist()
+
+def _pareto_sweep(x, y_key, order):
+    """Keep the points in ``order`` that strictly improve the best (smallest) y_key."""
+    keep = np.zeros(order.shape[0], dtype=np.bool_)
+    best_y = np.inf
+    best_x = np.nan
+    for k in range(order.shape[0]):
+        i = order[k]
+        if y_key[i] < best_y:
+            best_y = y_key[i]
+            best_x = x[i]
+            keep[k] = True
+        elif y_key[i] == best_y and x[i] == best_x:
+            # Exact duplicates do not dominate each other
+            keep[k] = True
+    return order[keep]
+
+# Candidate label offsets in points, tried in order: N, NE, E, SE, S, SW, W, NW
+label_candidates = [(0, 22), (24, 28), (30, -12), (24, -48), (0, -52), (-24, -48), (-30, -12), (-24, 28)]
+
+class LabelOccupancy:
+    """Screen-space occupancy bitmap used to place labels without overlap.
+
+    Each pixel row is packed into uint64 words (bit ``x % 64`` of word ``x // 64``,
+    rows padded to whole words), so a rectangle is tested or marked with
+    word-wide ``&`` / ``|`` on the same column masks for every row.
+    """
+
+    def __init__(self, width, height):
+        _jit_kernels()
+        self.width = max(int(np.ceil(width)), 0)
+        self.height = max(int(np.ceil(height)), 0)
+        self.words_per_row = -(-self.width // 64)
+        self.bits = np.zeros((self.height, self.words_per_row), dtype=np.uint64)
+
+    def _clip(self, x, y, w, h):
+        """Return integer pixel bounds (x0, y0, x1, y1), or None if the rectangle leaves the bitmap."""
+        x0, x1 = int(np.floor(x)), int(np.ceil(x + w))
+        y0, y1 = int(np.floor(y)), int(np.ceil(y + h))
+        if x0 < 0 or y0 < 0 or x1 > self.width or y1 > self.height or x0 >= x1 or y0 >= y1:
+            return None
+        return x0, y0, x1, y1
+
+    def lookup(self, x, y, w, h):
+        """Return True if any pixel of the rectangle is taken (or it falls outside)."""
+        bounds = self._clip(x, y, w, h)
+        if bounds is None:
+            return True
+        return bool(_bitmap_any(self.bits, *bounds))
+
+    def update(self, x, y, w, h):
+        """Mark the in-bounds part of the rectangle as taken."""
+        x0, y0 = max(x, 0), max(y, 0)
+        bounds = self._clip(x0, y0, min(x + w, self.width) - x0, min(y + h, self.height) - y0)
+        if bounds is not None:
+            _bitmap_set(self.bits, *bounds)
+
+def _row_masks(x0, x1):
+    """Return the first word index and the per-word bit masks covering columns [x0, x1)."""
+    w0 = x0 // 64
+    w1 = (x1 - 1) // 64 + 1
+    one = np.uint64(1)
+    masks = np.full(w1 - w0, ~np.uint64(0), dtype=np.uint64)
+    masks[0] &= ~((one << np.uint64(x0 - w0 * 64)) - one)
+    end = x1 - (w1 - 1) * 64
+    if end < 64:
+        masks[-1] &= (one << np.uint64(end)) - one
+    return w0, masks
+
+def _bitmap_any(bits, x0, y0, x1, y1):
+    """Return True as soon as any bit of the rectangle is set."""
+    w0, masks = _row_masks(x0, x1)
+    for r in range(y0, y1):
+        for k in range(masks.shape[0]):
+            if bits[r, w0 + k] & masks[k]:
+                return True
+    return False
+
+def _bitmap_set(bits, x0, y0, x1, y1):
+    """Set every bit of the rectangle."""
+    w0, masks = _row_masks(x0, x1)
+    for r in range(y0, y1):
+        for k in range(masks.shape[0]):
+            bits[r, w0 + k] |= masks[k]
+
+@functools.lru_cache(maxsize=None)
+def _jit_kernels():
+    """Compile the numeric kernels above with numba, once per process, on first use.
+
+    numba is optional and slow to import, so it is only loaded once a figure is
+    actually rendered; without it the kernels run as plain Python.
+    """
+    global _pareto_sweep, _row_masks, _bitmap_any, _bitmap_set
+    try:
+        from numba import njit
+    except ImportError:
+        return
+    # _row_masks is rebound first, so the bitmap kernels compile against its jitted version
+    _row_masks = njit(cache=True)(_row_masks)
+    _bitmap_any = njit(cache=True)(_bitmap_any)
+    _bitmap_set = njit(cache=True)(_bitmap_set)
+    _pareto_sweep = njit(cache=True)(_pareto_sweep)
+
+def adjust_label_positions(ax, x_vals, y_vals, names, fontsize=None, marker_area=None):
+    """Pick a label offset per point that avoids markers and previously placed labels.
+
+    Must be called after the axis limits and the figure layout are final. Each label takes the first
+    candidate in ``label_candidates`` whose bounding box is free in the
+    occupancy bitmap, falling back to the first candidate.
 
     Returns:
-        tuple[list[float], list[float]]: (x_offsets, y_offsets)
+        tuple[list[float], list[float]]: (x_offsets, y_offsets) in points
     """
-    num_points = len(x_vals)
-    positions = [(x_vals[i], y_vals[i]) for i in range(num_points)]
-    # Labels are large, so start with bigger default offsets
-    x_offsets = [0 for _ in range(num_points)]
-    y_offsets = [22 for _ in range(num_points)]
-
-    x_range = max(x_vals) - min(x_vals) if num_points > 0 else 0
-    # Perform multiple passes to relieve collisions
-    for _ in range(3):
-        for i in range(num_points):
-            for j in range(i + 1, num_points):
-                x_diff = abs(positions[i][0] - positions[j][0])
-                y_diff = abs(positions[i][1] - positions[j][1])
-                rel_x_diff = (x_diff / x_range) if x_range > 0 else 0
-                rel_y_diff = (y_diff / y_range) if y_range > 0 else 0
-
-                # If points are close in both axes, push their labels apart
-                if rel_x_diff < 0.05 and rel_y_diff < 0.05:
-                    # Alternate offsetting vertically and horizontally
-                    if positions[i][1] >= positions[j][1]:
-                        y_offsets[i] = max(y_offsets[i], 28)
-                        y_offsets[j] = min(y_offsets[j], -28)
-                    else:
-                        y_offsets[i] = min(y_offsets[i], -28)
-                        y_offsets[j] = max(y_offsets[j], 28)
-
-                    # Spread horizontally as well
-                    if positions[i][0] >= positions[j][0]:
-                        x_offsets[i] = min(x_offsets[i], -24)
-                        x_offsets[j] = max(x_offsets[j], 24)
-                    else:
-                        x_offsets[i] = max(x_offsets[i], 24)
-                        x_offsets[j] = min(x_offsets[j], -24)
+    from matplotlib.font_manager import FontProperties
+
+    fontsize = annotation_size if fontsize is None else fontsize
+    marker_area = marker_size if marker_area is None else marker_area
+
+    fig = ax.figure
+    px_per_pt = fig.dpi / 72.0
+    renderer = fig.canvas.get_renderer()
+    font = FontProperties(size=fontsize, weight='bold')
+
+    bbox = ax.get_window_extent(renderer)
+    occupancy = LabelOccupancy(bbox.width, bbox.height)
+    anchors = ax.transData.transform(np.column_stack((x_vals, y_vals))) - (bbox.x0, bbox.y0)
+
+    # Reserve the markers first so labels never cover a data point
+    radius = np.sqrt(marker_area) / 2 * px_per_pt
+    for px, py in anchors:
+        occupancy.update(px - radius, py - radius, 2 * radius, 2 * radius)
+
+    x_offsets, y_offsets = [], []
+    for (px, py), name in zip(anchors, names):
+        width, height, descent = renderer.get_text_width_height_descent(name, font, ismath=False)
+        # Labels sit on their baseline; descenders are allowed to touch the marker
+        ascent = height - descent
+
+        chosen = label_candidates[0]
+        chosen_box = None
+        for dx, dy in label_candidates:
+            left = px + dx * px_per_pt - (0 if dx > 0 else width if dx < 0 else width / 2)
+            box = (left, py + dy * px_per_pt, width, ascent)
+            if chosen_box is None:
+                chosen_box = box
+            if not occupancy.lookup(*box):
+                chosen, chosen_box = (dx, dy), box
+                break
+
+        occupancy.update(*chosen_box)
+        x_offsets.append(chosen[0])
+        y_offsets.append(chosen[1])
 
     return x_offsets, y_offsets
 
-pareto_mae = find_pareto_frontier(Time_per_step, MAE_normal, True, True)
-pareto_mae.sort(key=lambda i: Time_per_step[i])
-pareto_rate = find_pareto_frontier(Time_per_step, normal_ratio, True, False)
-pareto_rate.sort(key=lambda i: Time_per_step[i])
+# Above this many points the circle markers are stamped into one image instead of drawn as paths
+raster_threshold = 500
+
+def rasterize_scatter(ax, x_vals, y_vals, colors, size, edge_width=2, zorder=4):
+    """Draw circle markers by alpha-blending a sprite per point into one RGBA image.
+
+    Must be called after the axis limits, the figure layout, and the output dpi
+    are final. ``size`` and ``edge_width``
+    follow ``ax.scatter`` units (points**2 and points).
+    """
+    from matplotlib.colors import to_rgba_array
+
+    fig = ax.figure
+    px_per_pt = fig.dpi / 72.0
+    bbox = ax.get_window_extent(fig.canvas.get_renderer())
+    width, height = int(np.ceil(bbox.width)), int(np.ceil(bbox.height))
+    buf = np.zeros((height, width, 4), dtype=np.float32)
+
+    # One anti-aliased disc sprite: fill coverage and black edge-ring coverage
+    # The edge is stroked centred on the marker outline, as matplotlib does
+    radius = np.sqrt(size) / 2 * px_per_pt
+    edge = edge_width / 2 * px_per_pt
+    half = int(np.ceil(radius + edge + 1))
+    yy, xx = np.mgrid[-half:half + 1, -half:half + 1]
+    dist = np.hypot(xx, yy)
+    disc = np.clip(radius + edge + 0.5 - dist, 0, 1)
+    fill = np.clip(radius - edge + 0.5 - dist, 0, 1)
+
+    rgba = to_rgba_array(colors)
+    centers = np.rint(ax.transData.transform(np.column_stack((x_vals, y_vals))) - (bbox.x0, bbox.y0)).astype(int)
+    for (cx, cy), color in zip(centers, rgba):
+        x0, x1 = max(cx - half, 0), min(cx + half + 1, width)
+        y0, y1 = max(cy - half, 0), min(cy + half + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        sl = (slice(y0 - (cy - half), y1 - (cy - half)), slice(x0 - (cx - half), x1 - (cx - half)))
+        # Marker color inside the fill, fading to the black edge ring outside it
+        src = fill[sl][..., None] * color[:3]
+        alpha = disc[sl][..., None] * color[3]
+        dst = buf[y0:y1, x0:x1]
+        dst[..., :3] = src * alpha + dst[..., :3] * (1 - alpha)
+        dst[..., 3:] = alpha + dst[..., 3:] * (1 - alpha)
+
+    # Colors were blended premultiplied; undo that before handing the buffer to imshow
+    image = buf.copy()
+    covered = image[..., 3:] > 0
+    image[..., :3] = np.divide(image[..., :3], image[..., 3:], out=np.zeros_like(image[..., :3]), where=covered)
+
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    ax.imshow((image * 255).round().astype(np.uint8), extent=xlim + ylim, origin='lower',
+              aspect='auto', interpolation='nearest', zorder=zorder)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
 
 # ===== Alternate version: keep only x/y ticks and remove all other text =====
 def strip_texts_keep_ticks(ax):
@@ -157,116 +356,169 @@ def strip_texts_keep_ticks(ax):
     for txt in list(ax.texts):
         txt.set_visible(False)
 
-# Skip saving the combined ticks-only plot
-plt.close()
-
-print("Final dual Pareto plot complete!")
-print(f"Performance Pareto optimal: {[MLIP_names[i] for i in pareto_mae]}")
-print(f"Stability Pareto optimal: {[MLIP_names[i] for i in pareto_rate]}")
-
-# ===== Generate standalone plots: figure b (performance) and figure c (stability) =====
-# Figure b: performance vs. efficiency
-fig_b, ax_b = plt.subplots(1, 1, figsize=(15, 12))
-
-# Re-create the left-hand plot
-y_range_mae_b = max(MAE_normal) - min(MAE_normal)
-label_x_offsets_mae_b, label_offsets_mae_b = adjust_label_positions(Time_per_step, MAE_normal, MLIP_names, y_range_mae_b)
-
-for i, (x, y, name, color) in enumerate(zip(Time_per_step, MAE_normal, MLIP_names, colors)):
-    if i in pareto_mae:
-        ax_b.scatter(x, y, s=marker_size*1.3, c=color, marker='*', edgecolors='black', linewidth=3, zorder=5)
-    else:
-        ax_b.scatter(x, y, s=marker_size, c=color, marker='o', edgecolors='black', linewidth=2, zorder=4)
-    ax_b.annotate(
-        name,
-        (x, y),
-        xytext=(label_x_offsets_mae_b[i], label_offsets_mae_b[i]),
-        textcoords='offset points',
-        ha=('left' if label_x_offsets_mae_b[i] > 0 else ('right' if label_x_offsets_mae_b[i] < 0 else 'center')),
-        fontsize=annotation_size,
-        weight='bold',
-    )
-
-if len(pareto_mae) > 1:
-    pareto_x_b = [Time_per_step[i] for i in pareto_mae]
-    pareto_y_b = [MAE_normal[i] for i in pareto_mae]
-    for i in range(len(pareto_x_b) - 1):
-        ax_b.plot([pareto_x_b[i], pareto_x_b[i+1]], [pareto_y_b[i], pareto_y_b[i]], 'r-', linewidth=2.5, alpha=0.5)
-        ax_b.plot([pareto_x_b[i+1], pareto_x_b[i+1]], [pareto_y_b[i], pareto_y_b[i+1]], 'r-', linewidth=2.5, alpha=0.5)
-    min_time_b = min(Time_per_step)
-    ax_b.fill_between([min_time_b] + pareto_x_b + [max(Time_per_step)*1.15], [pareto_y_b[0]] + pareto_y_b + [pareto_y_b[-1]], max(MAE_normal)*1.1, alpha=0.1, color='red')
-
-ax_b.set_xlabel('Time per step (s)', fontsize=label_size, weight='bold', labelpad=label_pad)
-ax_b.set_ylabel('Normal MAE (eV)', fontsize=label_size, weight='bold', labelpad=label_pad)
-ax_b.grid(True, alpha=0.3, linestyle='--', linewidth=1)
-ax_b.tick_params(axis='both', labelsize=tick_size, length=8, width=2, pad=8)
-[spine.set_linewidth(4) for spine in ax_b.spines.values()]
-
-x_margin_b = (max(Time_per_step) - min(Time_per_step)) * 0.15
-y_margin_b = (max(MAE_normal) - min(MAE_normal)) * 0.1
-ax_b.set_xlim(-0.015, max(Time_per_step) + x_margin_b)
-ax_b.set_ylim(min(MAE_normal) - y_margin_b, max(MAE_normal) + y_margin_b)
-
-plt.tight_layout()
-plt.savefig('b/figure3b.png', dpi=300, bbox_inches='tight')
-
-# ticks-only for b
-strip_texts_keep_ticks(ax_b)
-plt.tight_layout()
-plt.savefig('b/figure3b_ticks.png', dpi=300, bbox_inches='tight')
-plt.close(fig_b)
-
-# Figure c: stability vs. efficiency
-fig_c, ax_c = plt.subplots(1, 1, figsize=(15, 12))
-
-y_range_rate_c = max(normal_ratio) - min(normal_ratio)
-label_x_offsets_rate_c, label_offsets_rate_c = adjust_label_positions(Time_per_step, normal_ratio, MLIP_names, y_range_rate_c)
-
-for i, (x, y, name, color) in enumerate(zip(Time_per_step, normal_ratio, MLIP_names, colors)):
-    if i in pareto_rate:
-        ax_c.scatter(x, y, s=marker_size*1.3, c=color, marker='*', edgecolors='black', linewidth=3, zorder=5)
+def render_pareto(ax, x, y, pareto_idx, pareto_mask, names, colors, xlabel, ylabel, line_color, fill_to,
+                  yticks=None, y_clip=(None, None), label_dy=0):
+    """Draw one Pareto scatter panel: limits, markers, frontier, axis styling, and labels.
+
+    ``pareto_idx`` lists the frontier points in drawing order and
+    ``pareto_mask`` flags the same points as a boolean array over ``x``.
+    ``fill_to`` is the y value the shaded region extends to from the frontier.
+    With ``yticks`` the y range is widened to contain the ticks and clipped to
+    ``y_clip``; otherwise it gets a 10% margin around the data.
+    The figure is laid out with ``tight_layout`` before the labels (and any
+    rasterized markers) are placed.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Data bounds are reused for limits, margins, and the shaded region
+    x_min, x_max = x.min(), x.max()
+    y_min, y_max = y.min(), y.max()
+
+    x_margin = (x_max - x_min) * 0.15
+    ax.set_xlim(-0.015, x_max + x_margin)
+    if yticks is None:
+        y_margin = (y_max - y_min) * 0.1
+        ax.set_ylim(y_min - y_margin, y_max + y_margin)
     else:
-        ax_c.scatter(x, y, s=marker_size, c=color, marker='o', edgecolors='black', linewidth=2, zorder=4)
-    ax_c.annotate(
-        name,
-        (x, y),
-        xytext=(label_x_offsets_rate_c[i], label_offsets_rate_c[i] + 3),
-        textcoords='offset points',
-        ha=('left' if label_x_offsets_rate_c[i] > 0 else ('right' if label_x_offsets_rate_c[i] < 0 else 'center')),
-        fontsize=annotation_size,
-        weight='bold',
-    )
-
-if len(pareto_rate) > 1:
-    pareto_x_c = [Time_per_step[i] for i in pareto_rate]
-    pareto_y_c = [normal_ratio[i] for i in pareto_rate]
-    for i in range(len(pareto_x_c) - 1):
-        ax_c.plot([pareto_x_c[i], pareto_x_c[i+1]], [pareto_y_c[i], pareto_y_c[i]], 'b-', linewidth=2.5, alpha=0.5)
-        ax_c.plot([pareto_x_c[i+1], pareto_x_c[i+1]], [pareto_y_c[i], pareto_y_c[i+1]], 'b-', linewidth=2.5, alpha=0.5)
-    min_time_c = min(Time_per_step)
-    ax_c.fill_between([min_time_c] + pareto_x_c + [max(Time_per_step)*1.15], 0, [pareto_y_c[0]] + pareto_y_c + [pareto_y_c[-1]], alpha=0.1, color='blue')
-
-ax_c.set_xlabel('Time per step (s)', fontsize=label_size, weight='bold', labelpad=label_pad)
-ax_c.set_ylabel('Normal Rate (%)', fontsize=label_size, weight='bold', labelpad=label_pad)
-ax_c.grid(True, alpha=0.3, linestyle='--', linewidth=1)
-ax_c.tick_params(axis='both', labelsize=tick_size, length=8, width=2, pad=8)
-[spine.set_linewidth(4) for spine in ax_c.spines.values()]
-
-ax_c.set_xlim(-0.015, max(Time_per_step) + x_margin_b)
-# Lock the y-ticks to specific values and ensure the range contains them
-desired_ticks_c = [73, 77, 81, 85]
-ymin_c = min(min(normal_ratio), min(desired_ticks_c))
-ymax_c = max(max(normal_ratio), max(desired_ticks_c))
-y_span_c = max(1e-9, ymax_c - ymin_c)
-y_pad_c = 0.05 * y_span_c
-ax_c.set_ylim(max(0, ymin_c - y_pad_c), min(100, ymax_c + y_pad_c))
-ax_c.set_yticks(desired_ticks_c)
-
-plt.tight_layout()
-plt.savefig('c/figure3c.png', dpi=300, bbox_inches='tight')
-
-# ticks-only for c
-strip_texts_keep_ticks(ax_c)
-plt.tight_layout()
-plt.savefig('c/figure3c_ticks.png', dpi=300, bbox_inches='tight')
-plt.close(fig_c)
\ No newline at end of file
+        # Lock the y-ticks to specific values and ensure the range contains them
+        ymin = min(y_min, min(yticks))
+        ymax = max(y_max, max(yticks))
+        y_pad = 0.05 * max(1e-9, ymax - ymin)
+        lo, hi = ymin - y_pad, ymax + y_pad
+        if y_clip[0] is not None:
+            lo = max(y_clip[0], lo)
+        if y_clip[1] is not None:
+            hi = min(y_clip[1], hi)
+        ax.set_ylim(lo, hi)
+        ax.set_yticks(yticks)
+
+    # One collection for the Pareto stars and one for the remaining circles
+    star_mask = np.asarray(pareto_mask, dtype=bool)
+    colors = np.asarray(colors)
+    ax.scatter(x[star_mask], y[star_mask], s=marker_size*1.3, c=colors[star_mask], marker='*', edgecolors='black', linewidth=3, zorder=5)
+    # Large point clouds are stamped into one image once the layout is final (below)
+    rasterize = len(x) > raster_threshold
+    if not rasterize:
+        ax.scatter(x[~star_mask], y[~star_mask], s=marker_size, c=colors[~star_mask], marker='o', edgecolors='black', linewidth=2, zorder=4)
+
+    if len(pareto_idx) > 1:
+        pareto_x = [x[i] for i in pareto_idx]
+        pareto_y = [y[i] for i in pareto_idx]
+        for i in range(len(pareto_x) - 1):
+            ax.plot([pareto_x[i], pareto_x[i+1]], [pareto_y[i], pareto_y[i]], '-', color=line_color, linewidth=2.5, alpha=0.5)
+            ax.plot([pareto_x[i+1], pareto_x[i+1]], [pareto_y[i], pareto_y[i+1]], '-', color=line_color, linewidth=2.5, alpha=0.5)
+        ax.fill_between([x_min] + pareto_x + [x_max*1.15], [pareto_y[0]] + pareto_y + [pareto_y[-1]], fill_to, alpha=0.1, color=line_color)
+
+    ax.set_xlabel(xlabel, fontsize=label_size, weight='bold', labelpad=label_pad)
+    ax.set_ylabel(ylabel, fontsize=label_size, weight='bold', labelpad=label_pad)
+    ax.grid(True, alpha=0.3, linestyle='--', linewidth=1)
+    ax.tick_params(axis='both', labelsize=tick_size, length=8, width=2, pad=8)
+    [spine.set_linewidth(4) for spine in ax.spines.values()]
+
+    # Rasterized markers and labels are placed in display space, so the layout has to be final first
+    ax.figure.tight_layout()
+    if rasterize:
+        rasterize_scatter(ax, x[~star_mask], y[~star_mask], colors[~star_mask], marker_size)
+    x_offsets, y_offsets = adjust_label_positions(ax, x, y, names)
+    ha = ['left' if dx > 0 else ('right' if dx < 0 else 'center') for dx in x_offsets]
+    for xi, yi, name, dx, dy, align in zip(x, y, names, x_offsets, y_offsets, ha):
+        ax.annotate(
+            name,
+            (xi, yi),
+            xytext=(dx, dy + label_dy),
+            textcoords='offset points',
+            ha=align,
+            fontsize=annotation_size,
+            weight='bold',
+        )
+
+def render_pareto_and_save(config):
+    """Render one figure from ``config`` and write its annotated and ticks-only PNGs."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    setup_fonts()
+    fig, ax = plt.subplots(1, 1, figsize=(15, 12))
+    # Render at the output resolution, since rasterized markers are sized from fig.dpi
+    fig.set_dpi(300)
+    render_pareto(ax, **config['plot'])
+
+    # print_png renders through Agg directly; render_pareto already laid out the figure
+    fig.canvas.print_png(config['output'])
+
+    # ticks-only variant (only visibility changes, so the layout is reused), written at
+    # half resolution: the tick labels are rasterized at ticks_dpi instead of 300 dpi
+    strip_texts_keep_ticks(ax)
+    fig.set_dpi(ticks_dpi)
+    fig.canvas.print_png(config['ticks_output'])
+    plt.close(fig)
+
+def main():
+    """Render figures 3b and 3c unless they are already up to date."""
+    current_stamp = input_stamp()
+    if figures_up_to_date(current_stamp):
+        print("Figures are up to date; skipping rendering.")
+        return
+
+    # Load the Excel sheet
+    df = load_mlip_data(excel_path)
+
+    # Extract metrics for each MLIP in one indexed lookup (first row wins on duplicates)
+    sub = (df.drop_duplicates(subset='MLIP_name')
+             .set_index('MLIP_name')
+             .loc[MLIP_models, ['MAE_normal (eV)', 'Time_per_step (s)', 'Normal ratio (%)']])
+    MAE_normal = sub['MAE_normal (eV)'].to_numpy(dtype=np.float64)
+    Time_per_step = sub['Time_per_step (s)'].to_numpy(dtype=np.float64)
+    normal_ratio = sub['Normal ratio (%)'].to_numpy(dtype=np.float64)
+    mae_max = MAE_normal.max()
+
+    # Unique color per model pulled from the centralized palette
+    colors, _ = _cached_colors(tuple(MLIP_names), True)
+
+    pareto_mae = find_pareto_frontier(Time_per_step, MAE_normal, True, True)
+    pareto_rate = find_pareto_frontier(Time_per_step, normal_ratio, True, False)
+    pareto_mae_mask = np.zeros(len(Time_per_step), dtype=bool)
+    pareto_mae_mask[pareto_mae] = True
+    pareto_rate_mask = np.zeros(len(Time_per_step), dtype=bool)
+    pareto_rate_mask[pareto_rate] = True
+
+    print(f"Performance Pareto optimal: {[MLIP_names[i] for i in pareto_mae]}")
+    print(f"Stability Pareto optimal: {[MLIP_names[i] for i in pareto_rate]}")
+
+    # ===== Generate standalone plots: figure b (performance) and figure c (stability) =====
+    config_b = {
+        'output': 'b/figure3b.png',
+        'ticks_output': 'b/figure3b_ticks.png',
+        'plot': dict(
+            x=Time_per_step, y=MAE_normal, pareto_idx=pareto_mae, pareto_mask=pareto_mae_mask,
+            names=MLIP_names, colors=colors,
+            xlabel='Time per step (s)', ylabel='Normal MAE (eV)', line_color='red',
+            fill_to=mae_max*1.1,
+        ),
+    }
+    config_c = {
+        'output': 'c/figure3c.png',
+        'ticks_output': 'c/figure3c_ticks.png',
+        'plot': dict(
+            x=Time_per_step, y=normal_ratio, pareto_idx=pareto_rate, pareto_mask=pareto_rate_mask,
+            names=MLIP_names, colors=colors,
+            xlabel='Time per step (s)', ylabel='Normal Rate (%)', line_color='blue',
+            fill_to=0, yticks=[73, 77, 81, 85], y_clip=(0, 100), label_dy=3,
+        ),
+    }
+
+    # Each figure renders in its own process with independent matplotlib state
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        list(executor.map(render_pareto_and_save, [config_b, config_c]))
+
+    # Record the inputs these figures were rendered from
+    for stamp_path in figure_outputs:
+        with open(stamp_path, 'w') as f:
+            f.write(current_stamp + '\n')
+
+    print("Final dual Pareto plot complete!")
+
+
+if __name__ == "__main__":
+    main()
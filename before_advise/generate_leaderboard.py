@@ -5,24 +5,299 @@ This script aggregates benchmark results from multiple datasets and generates
 an interactive leaderboard website for GitHub Pages deployment.
 """
 
+import argparse
+import hashlib
 import json
-import pandas as pd
+import os
+import pickle
 import numpy as np
+import pandas as pd
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import warnings
 import openpyxl
+from openpyxl.worksheet.cell_range import CellRange
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib encoder produces the same JSON, only slower
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel below runs as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    # python-calamine is optional; plain value reads fall back to openpyxl
+    CalamineWorkbook = None
+
+# Exact cell value types formatted as numbers; bool is its own type, so it is excluded
+_NUMERIC_TYPES = frozenset({int, float})
+
+# Element-wise numeric test over an object array of cell values
+_is_number = np.vectorize(lambda v: type(v) in _NUMERIC_TYPES, otypes=[bool])
+
+
+@njit(cache=True)
+def _grouped_stats(codes, values, weights, n_groups, weighted):
+    """Mean, population std, min, max, and count of ``values`` per group code, skipping NaNs.
+
+    With ``weighted`` the mean is weighted by ``weights`` wherever the group's
+    weight sum is positive; the std is always taken about the plain mean.
+    """
+    count = np.zeros(n_groups, dtype=np.int64)
+    total = np.zeros(n_groups)
+    weighted_total = np.zeros(n_groups)
+    weight_sum = np.zeros(n_groups)
+    lo = np.full(n_groups, np.inf)
+    hi = np.full(n_groups, -np.inf)
+    for i in range(values.shape[0]):
+        v = values[i]
+        if np.isnan(v):
+            continue
+        g = codes[i]
+        count[g] += 1
+        total[g] += v
+        weighted_total[g] += v * weights[i]
+        weight_sum[g] += weights[i]
+        lo[g] = min(lo[g], v)
+        hi[g] = max(hi[g], v)
+
+    mean = np.full(n_groups, np.nan)
+    for g in range(n_groups):
+        if count[g] > 0:
+            mean[g] = total[g] / count[g]
+
+    squares = np.zeros(n_groups)
+    for i in range(values.shape[0]):
+        v = values[i]
+        if not np.isnan(v):
+            d = v - mean[codes[i]]
+            squares[codes[i]] += d * d
+
+    std = np.full(n_groups, np.nan)
+    for g in range(n_groups):
+        if count[g] > 0:
+            std[g] = np.sqrt(squares[g] / count[g])
+            if weighted and weight_sum[g] > 0:
+                mean[g] = weighted_total[g] / weight_sum[g]
+        else:
+            lo[g] = np.nan
+            hi[g] = np.nan
+    return mean, std, lo, hi, count
+
+
+def find_benchmark_files(results_dir):
+    """Yield ``(dataset_name, path)`` for each ``<dataset>/<dataset>_Benchmarking_Analysis.xlsx``."""
+    with os.scandir(results_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            path = os.path.join(entry.path, f"{entry.name}_Benchmarking_Analysis.xlsx")
+            if os.path.isfile(path):
+                yield entry.name, path
+
+
+def read_sheet_values(excel_file, sheet_name):
+    """Return the cell values of one sheet as row lists, with empty cells as None.
+
+    Uses the Rust-backed python-calamine reader when it is installed and a
+    read-only openpyxl scan otherwise.
+    """
+    if CalamineWorkbook is not None:
+        sheet = CalamineWorkbook.from_path(str(excel_file)).get_sheet_by_name(sheet_name)
+        # calamine reports empty cells as '' and would otherwise trim leading empty rows/columns
+        return [[None if value == '' else value for value in row]
+                for row in sheet.to_python(skip_empty_area=False)]
+
+    wb = openpyxl.load_workbook(excel_file, read_only=True, data_only=True, keep_links=False)
+    try:
+        return [list(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+def _read_num_total(col_idx, mlip_rows):
+    """Dataset size: ``Num_total`` of the first MLIP row, or 0 if the column or rows are missing."""
+    if 'Num_total' not in col_idx or not mlip_rows:
+        return 0
+    return int(mlip_rows[0][col_idx['Num_total']])
+
+
+def read_merged_ranges(excel_file_path, sheet_names):
+    """Return ``{sheet_name: [CellRange, ...]}`` with the merged ranges of ``sheet_names``.
+
+    Read-only worksheets do not expose ``merged_cells``, so the ranges come from
+    python-calamine when it reports them and from a regular openpyxl load otherwise.
+    """
+    merged = {}
+    if CalamineWorkbook is not None:
+        calamine_wb = CalamineWorkbook.from_path(str(excel_file_path))
+        for sheet_name in sheet_names:
+            # merged_cell_ranges is missing from older python-calamine releases
+            ranges = getattr(calamine_wb.get_sheet_by_name(sheet_name), 'merged_cell_ranges', None)
+            if ranges is not None:
+                merged[sheet_name] = [CellRange(min_col=c0 + 1, min_row=r0 + 1, max_col=c1 + 1, max_row=r1 + 1)
+                                      for (r0, c0), (r1, c1) in ranges]
+
+    missing = [sheet_name for sheet_name in sheet_names if sheet_name not in merged]
+    if missing:
+        wb = openpyxl.load_workbook(excel_file_path, data_only=True, keep_links=False)
+        try:
+            for sheet_name in missing:
+                merged[sheet_name] = list(wb[sheet_name].merged_cells.ranges)
+        finally:
+            wb.close()
+
+    return merged
+
+
+def _extract_one(excel_file_path, export_sheets=None):
+    """Read the sheets of one benchmark workbook as ``{sheet: {'columns': ..., 'data': ...}}``.
+
+    Only sheets named in ``export_sheets`` are read when it is non-empty.
+    Runs in a worker process, so it opens (and closes) its own read-only workbook.
+    """
+    # Stream cell values in read-only mode; merged ranges are read separately
+    wb = openpyxl.load_workbook(excel_file_path, data_only=True, read_only=True, keep_links=False)
+    try:
+        dataset_sheets = {}
+        sheet_names = [name for name in wb.sheetnames if not export_sheets or name in export_sheets]
+        merged_by_sheet = read_merged_ranges(excel_file_path, sheet_names)
+
+        for sheet_name in sheet_names:
+            ws = wb[sheet_name]
+
+            # Process merged cells to create proper headers
+            merged_ranges = merged_by_sheet[sheet_name]
+
+            # Read all rows
+            raw_rows = [list(row) for row in ws.iter_rows(values_only=True)]
+            max_col = ws.max_column
+
+            # Lay the sheet out as one object array; read-only rows are only as wide
+            # as the sheet's <dimension> tag says, so short rows are padded with None
+            n_rows = len(raw_rows)
+            n_cols = max([max_col or 0, *(len(row) for row in raw_rows)])
+            cells = np.empty((n_rows, n_cols), dtype=object)
+            for row_idx, row in enumerate(raw_rows):
+                cells[row_idx, :len(row)] = row
+
+            # Map every cell of a merged range to the range's top-left value,
+            # clipped to the rows and columns that were actually streamed
+            merge_map = {}
+            for merged_range in merged_ranges:
+                if merged_range.min_row > n_rows or merged_range.min_col > n_cols:
+                    continue
+                top_left = cells[merged_range.min_row - 1, merged_range.min_col - 1]
+                for r in range(merged_range.min_row, min(merged_range.max_row, n_rows) + 1):
+                    for c in range(merged_range.min_col, min(merged_range.max_col, n_cols) + 1):
+                        merge_map.setdefault((r, c), top_left)
+
+            if cells.size:
+                # Empty cells inside a merged range take the top-left value
+                for (r, c), top_left in merge_map.items():
+                    if cells[r - 1, c - 1] is None:
+                        cells[r - 1, c - 1] = top_left
+
+                # Format numeric values to 2 decimal places (very small numbers become 0)
+                numeric = _is_number(cells)
+                nums = cells[numeric].astype(np.float64)
+                nums = np.where(np.abs(nums) < 1e-10, 0.0, np.round(nums, 2))
+                cells[numeric] = nums.tolist()
+                cells[np.equal(cells, None)] = ''
+            all_rows = cells.tolist()
+
+            # Extract headers (first 2 rows for merged headers)
+            if len(all_rows) >= 2:
+                header_row1 = all_rows[0]
+                header_row2 = all_rows[1]
+
+                # Per-column merge tables, built in one pass over the merged ranges:
+                # the main header of a horizontal merge in row 1 ('' if that header is empty),
+                # and the first column of a vertical merge spanning rows 1-2
+                width = len(header_row1)
+                horizontal_main = [None] * width
+                vertical_ref = [None] * width
+                for merged_range in merged_ranges:
+                    cols = range(merged_range.min_col - 1, min(merged_range.max_col, width))
+                    if merged_range.min_row == 1 and merged_range.max_row == 1:
+                        main_header = header_row1[merged_range.min_col - 1] if merged_range.min_col <= width else ''
+                        for col in cols:
+                            if horizontal_main[col] is None:
+                                horizontal_main[col] = main_header or ''
+                    elif merged_range.min_row == 1 and merged_range.max_row == 2:
+                        for col in cols:
+                            vertical_ref[col] = merged_range.min_col - 1
+
+                # Combine headers for merged cells
+                headers = []
+
+                for i in range(width):
+                    h1 = header_row1[i] if header_row1[i] else ''
+                    h2 = header_row2[i] if i < len(header_row2) and header_row2[i] else ''
+
+                    # If column is part of horizontal merge, use main header
+                    if horizontal_main[i]:
+                        if h2:
+                            headers.append(f"{horizontal_main[i]} - {h2}")
+                        else:
+                            headers.append(horizontal_main[i])
+                    # If column is part of vertical merge, use row 1 value
+                    elif vertical_ref[i] is not None:
+                        h1_ref = header_row1[vertical_ref[i]]
+                        headers.append(h1_ref if h1_ref else h1)
+                    # Normal case: combine both rows if both have values
+                    elif h1 and h2:
+                        headers.append(f"{h1} - {h2}")
+                    elif h1:
+                        headers.append(h1)
+                    elif h2:
+                        headers.append(h2)
+                    else:
+                        headers.append(f"Column {i+1}")
+
+                # Data rows start from row 3 (index 2)
+                data_rows = all_rows[2:] if len(all_rows) > 2 else []
+            else:
+                headers = [f"Column {i+1}" for i in range(max_col)]
+                data_rows = all_rows[1:] if len(all_rows) > 1 else []
+
+            dataset_sheets[sheet_name] = {
+                'columns': headers,
+                'data': data_rows
+            }
+    finally:
+        wb.close()
+
+    return dataset_sheets
+
 
 class LeaderboardGenerator:
     """Generate leaderboard data from CatBench benchmark results."""
 
-    def __init__(self, results_dir='results/cathub', output_dir='docs'):
+    def __init__(self, results_dir='results/cathub', output_dir='docs', use_cache=True, export_sheets=None):
         self.results_dir = Path(results_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
+        # Extracted sheets are cached per workbook, keyed on its path, mtime, and size
+        self.use_cache = use_cache
+        self.cache_dir = self.output_dir / '.cache'
+
+        # Sheet names to export into excel_data (None = every sheet)
+        self.export_sheets = export_sheets
+
         # Define key metrics to track
         self.key_metrics = [
             'MAE_total (eV)',
@@ -33,6 +308,8 @@ class LeaderboardGenerator:
         ]
 
         # Store all aggregated data
+        self.results_df = None  # long table: one row per (MLIP, dataset)
+        self.mlip_summary = None  # one row per MLIP: overall score, coverage, metric means/stds
         self.leaderboard_data = {}
         self.dataset_info = {}
         self.mlip_info = {}
@@ -42,182 +319,155 @@ class LeaderboardGenerator:
         print("📊 Collecting benchmark data...")
 
         # Find all Excel files
-        excel_files = list(self.results_dir.glob('*/*_Benchmarking_Analysis.xlsx'))
+        excel_files = list(find_benchmark_files(self.results_dir))
         print(f"Found {len(excel_files)} benchmark files")
 
-        for excel_file in excel_files:
-            dataset_name = excel_file.parent.name
+        # One record per (MLIP, dataset) pair, materialized as a long table below
+        records = []
+
+        for dataset_name, excel_file in excel_files:
             print(f"  Processing {dataset_name}...")
 
             try:
-                # Read MLIP_Data sheet
-                df = pd.read_excel(excel_file, sheet_name='MLIP_Data')
-
-                # Clean the dataframe (remove NaN rows)
-                df = df.dropna(subset=['MLIP_name'])
+                # Scan the MLIP_Data sheet directly; the first row holds the column names
+                rows = iter(read_sheet_values(excel_file, 'MLIP_Data'))
+                header = next(rows, ())
+                col_idx = {}
+                for i, column in enumerate(header):
+                    col_idx.setdefault(column, i)
+                name_idx = col_idx['MLIP_name']
+                # Skip rows without an MLIP name (second header row, blank rows)
+                mlip_rows = [row for row in rows if row[name_idx] is not None]
 
                 # Store dataset info
                 if dataset_name not in self.dataset_info:
                     # Store absolute path for Excel extraction
                     self.dataset_info[dataset_name] = {
                         'name': dataset_name,
-                        'num_structures': int(df['Num_total'].iloc[0]) if 'Num_total' in df.columns and not df.empty else 0,
-                        'file_path': str(excel_file)  # Store absolute path
+                        'num_structures': _read_num_total(col_idx, mlip_rows),
+                        'file_path': excel_file  # Store absolute path
                     }
 
-                # Process each MLIP
-                for _, row in df.iterrows():
-                    mlip_name = row['MLIP_name']
-
-                    # Initialize MLIP data structure
-                    if mlip_name not in self.leaderboard_data:
-                        self.leaderboard_data[mlip_name] = {
-                            'datasets': {},
-                            'average_metrics': {}
-                        }
-
-                    # Store metrics for this dataset
-                    metrics = {}
-                    for metric in self.key_metrics:
-                        if metric in row and pd.notna(row[metric]):
-                            metrics[metric] = float(row[metric])
+                metric_idx = {metric: col_idx[metric] for metric in self.key_metrics if metric in col_idx}
 
-                    self.leaderboard_data[mlip_name]['datasets'][dataset_name] = metrics
+                # Process each MLIP
+                for row in mlip_rows:
+                    record = {'mlip': row[name_idx], 'dataset': dataset_name}
+                    for metric, idx in metric_idx.items():
+                        if row[idx] is not None:
+                            record[metric] = float(row[idx])
+                    records.append(record)
 
             except Exception as e:
                 print(f"    ⚠️ Error processing {dataset_name}: {e}")
                 continue
 
+        # Missing metrics become NaN; a repeated (MLIP, dataset) pair keeps its last row
+        self.results_df = (pd.DataFrame(records, columns=['mlip', 'dataset'] + self.key_metrics)
+                           .drop_duplicates(subset=['mlip', 'dataset'], keep='last'))
+
     def calculate_aggregate_metrics(self):
         """Calculate aggregate metrics across all datasets for each MLIP."""
         print("\n📈 Calculating aggregate metrics...")
 
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            datasets = mlip_data['datasets']
-
-            if not datasets:
-                continue
-
-            # Calculate averages across datasets
+        df = self.results_df
+        metrics = self.key_metrics
+        # Integer group code per row; MLIPs keep their order of first appearance
+        codes, mlip_names = pd.factorize(df['mlip'], sort=False)
+        # Dataset sizes looked up once; datasets without info weigh 1
+        size_by_ds = {name: info.get('num_structures', 1) for name, info in self.dataset_info.items()}
+        weights = df['dataset'].map(size_by_ds).fillna(1).to_numpy(dtype=np.float64)
+
+        # Per-MLIP statistics over the datasets where each metric is present;
+        # for MAE metrics, use weighted average (larger datasets have more weight)
+        stats = {name: {} for name in ('mean', 'std', 'min', 'max', 'count')}
+        for metric in metrics:
+            values = df[metric].to_numpy(dtype=np.float64)
+            results = _grouped_stats(codes, values, weights, len(mlip_names), 'MAE' in metric)
+            for name, result in zip(stats, results):
+                stats[name][metric] = result
+        means, stds, mins, maxs, counts = (pd.DataFrame(stats[name], index=mlip_names) for name in stats)
+
+        # Overall score (lower is better for MAE, higher for success rate):
+        # 40% MAE, 40% success rate, 20% speed
+        mae_score = 1.0 / (1.0 + means['MAE_total (eV)']) * 0.4
+        success_score = means['Normal rate (%)'] / 100.0 * 0.4
+        speed_score = 1.0 / (1.0 + means['Time_per_step (s)']) * 0.2
+        overall_score = mae_score.fillna(0.0) + success_score.fillna(0.0) + speed_score.fillna(0.0)
+
+        # MLIP-level summary table used for the rankings
+        summary = pd.DataFrame({
+            'overall_score': overall_score,
+            'num_datasets': np.bincount(codes, minlength=len(mlip_names)),
+        })
+        for metric in metrics:
+            summary[metric + ' mean'] = means[metric].where(counts[metric] > 0)
+            summary[metric + ' std'] = stds[metric]
+        self.mlip_summary = summary
+
+        # Per-dataset metrics for each MLIP, read by position from the column arrays
+        mlip_datasets = {mlip_name: {} for mlip_name in summary.index}
+        metric_arrays = {metric: df[metric].to_numpy(dtype=np.float64) for metric in metrics}
+        for i, (mlip_name, dataset_name) in enumerate(zip(df['mlip'].to_numpy(), df['dataset'].to_numpy())):
+            mlip_datasets[mlip_name][dataset_name] = {
+                metric: float(values[i]) for metric, values in metric_arrays.items() if not np.isnan(values[i])
+            }
+
+        # Nested per-MLIP view written to the JSON
+        self.leaderboard_data = {}
+        for mlip_name, datasets in mlip_datasets.items():
             avg_metrics = {}
-            for metric in self.key_metrics:
-                values = []
-                weights = []  # For weighted average based on dataset size
-                
-                for dataset_name, dataset_metrics in datasets.items():
-                    if metric in dataset_metrics:
-                        values.append(dataset_metrics[metric])
-                        # Use dataset size as weight for weighted average
-                        dataset_size = self.dataset_info.get(dataset_name, {}).get('num_structures', 1)
-                        weights.append(dataset_size)
-
-                if values:
-                    # For MAE metrics, use weighted average (larger datasets have more weight)
-                    if 'MAE' in metric:
-                        if sum(weights) > 0:
-                            weighted_mean = sum(v * w for v, w in zip(values, weights)) / sum(weights)
-                        else:
-                            weighted_mean = float(np.mean(values))
-                        avg_metrics[metric] = {
-                            'mean': weighted_mean,
-                            'std': float(np.std(values)),
-                            'min': float(np.min(values)),
-                            'max': float(np.max(values)),
-                            'count': len(values)
-                        }
-                    else:
-                        # For other metrics, use simple average
-                        avg_metrics[metric] = {
-                            'mean': float(np.mean(values)),
-                            'std': float(np.std(values)),
-                            'min': float(np.min(values)),
-                            'max': float(np.max(values)),
-                            'count': len(values)
-                        }
-
-            mlip_data['average_metrics'] = avg_metrics
-
-            # Calculate overall score (lower is better for MAE, higher for success rate)
-            score_components = []
-
-            # MAE contribution (normalized, lower is better)
-            if 'MAE_total (eV)' in avg_metrics:
-                mae_score = 1.0 / (1.0 + avg_metrics['MAE_total (eV)']['mean'])
-                score_components.append(mae_score * 0.4)  # 40% weight
-
-            # Success rate contribution (higher is better)
-            if 'Normal rate (%)' in avg_metrics:
-                success_score = avg_metrics['Normal rate (%)']['mean'] / 100.0
-                score_components.append(success_score * 0.4)  # 40% weight
-
-            # Speed contribution (lower is better, normalized)
-            if 'Time_per_step (s)' in avg_metrics:
-                speed_score = 1.0 / (1.0 + avg_metrics['Time_per_step (s)']['mean'])
-                score_components.append(speed_score * 0.2)  # 20% weight
-
-            mlip_data['overall_score'] = sum(score_components) if score_components else 0
-            mlip_data['num_datasets'] = len(datasets)
+            for metric in metrics:
+                if counts.at[mlip_name, metric]:
+                    avg_metrics[metric] = {
+                        'mean': float(means.at[mlip_name, metric]),
+                        'std': float(stds.at[mlip_name, metric]),
+                        'min': float(mins.at[mlip_name, metric]),
+                        'max': float(maxs.at[mlip_name, metric]),
+                        'count': int(counts.at[mlip_name, metric])
+                    }
+
+            self.leaderboard_data[mlip_name] = {
+                'datasets': datasets,
+                'average_metrics': avg_metrics,
+                'overall_score': float(summary.at[mlip_name, 'overall_score']),
+                'num_datasets': int(summary.at[mlip_name, 'num_datasets'])
+            }
 
     def generate_rankings(self):
         """Generate rankings for different metrics."""
         print("\n🏆 Generating rankings...")
 
+        summary = self.mlip_summary
+
+        def ranked(column, ascending):
+            # Stable sort keeps collection order among ties
+            subset = summary[summary[column].notna()]
+            return subset.sort_values(column, ascending=ascending, kind='stable')
+
+        def metric_ranking(metric, key, ascending):
+            table = ranked(metric + ' mean', ascending)
+            return [{'mlip': mlip_name, key: float(mean), 'std': float(std)}
+                    for mlip_name, mean, std in zip(table.index, table[metric + ' mean'], table[metric + ' std'])]
+
+        overall = ranked('overall_score', ascending=False)
+        coverage = ranked('num_datasets', ascending=False)
+
         rankings = {
-            'overall': [],
-            'accuracy': [],
-            'success_rate': [],
-            'speed': [],
-            'coverage': []
+            # Overall ranking (by composite score)
+            'overall': [{'mlip': mlip_name, 'score': float(score), 'num_datasets': int(count)}
+                        for mlip_name, score, count in zip(overall.index, overall['overall_score'], overall['num_datasets'])],
+            # Accuracy ranking (by MAE)
+            'accuracy': metric_ranking('MAE_total (eV)', 'mae', ascending=True),
+            # Success rate ranking
+            'success_rate': metric_ranking('Normal rate (%)', 'rate', ascending=False),
+            # Speed ranking
+            'speed': metric_ranking('Time_per_step (s)', 'time', ascending=True),
+            # Coverage ranking (number of datasets tested)
+            'coverage': [{'mlip': mlip_name, 'count': int(count)}
+                         for mlip_name, count in zip(coverage.index, coverage['num_datasets'])],
         }
 
-        # Overall ranking (by composite score)
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'overall_score' in mlip_data:
-                rankings['overall'].append({
-                    'mlip': mlip_name,
-                    'score': mlip_data['overall_score'],
-                    'num_datasets': mlip_data['num_datasets']
-                })
-        rankings['overall'].sort(key=lambda x: x['score'], reverse=True)
-
-        # Accuracy ranking (by MAE)
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'average_metrics' in mlip_data and 'MAE_total (eV)' in mlip_data['average_metrics']:
-                rankings['accuracy'].append({
-                    'mlip': mlip_name,
-                    'mae': mlip_data['average_metrics']['MAE_total (eV)']['mean'],
-                    'std': mlip_data['average_metrics']['MAE_total (eV)']['std']
-                })
-        rankings['accuracy'].sort(key=lambda x: x['mae'])
-
-        # Success rate ranking
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'average_metrics' in mlip_data and 'Normal rate (%)' in mlip_data['average_metrics']:
-                rankings['success_rate'].append({
-                    'mlip': mlip_name,
-                    'rate': mlip_data['average_metrics']['Normal rate (%)']['mean'],
-                    'std': mlip_data['average_metrics']['Normal rate (%)']['std']
-                })
-        rankings['success_rate'].sort(key=lambda x: x['rate'], reverse=True)
-
-        # Speed ranking
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'average_metrics' in mlip_data and 'Time_per_step (s)' in mlip_data['average_metrics']:
-                rankings['speed'].append({
-                    'mlip': mlip_name,
-                    'time': mlip_data['average_metrics']['Time_per_step (s)']['mean'],
-                    'std': mlip_data['average_metrics']['Time_per_step (s)']['std']
-                })
-        rankings['speed'].sort(key=lambda x: x['time'])
-
-        # Coverage ranking (number of datasets tested)
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            rankings['coverage'].append({
-                'mlip': mlip_name,
-                'count': mlip_data['num_datasets']
-            })
-        rankings['coverage'].sort(key=lambda x: x['count'], reverse=True)
-
         return rankings
 
     def extract_excel_data(self):
@@ -225,6 +475,7 @@ class LeaderboardGenerator:
         print("\n📋 Extracting Excel data for dataset views...")
         
         excel_data = {}
+        jobs = {}  # dataset name -> resolved workbook path
         
         for dataset_name, dataset_info in self.dataset_info.items():
             excel_file_path = Path(dataset_info['file_path'])
@@ -245,121 +496,74 @@ class LeaderboardGenerator:
                 print(f"    ⚠️ Excel file not found: {excel_file_path}")
                 continue
             
-            try:
-                # Read Excel file with openpyxl to handle merged cells
-                wb = openpyxl.load_workbook(excel_file_path, data_only=True)
-                dataset_sheets = {}
-                
-                for sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                    
-                    # Process merged cells to create proper headers
-                    merged_ranges = list(ws.merged_cells.ranges)
-                    
-                    # Read all rows
-                    all_rows = []
-                    max_row = ws.max_row
-                    max_col = ws.max_column
-                    
-                    for row_idx in range(1, max_row + 1):
-                        row_data = []
-                        for col_idx in range(1, max_col + 1):
-                            cell = ws.cell(row=row_idx, column=col_idx)
-                            value = cell.value
-                            
-                            # Check if cell is part of a merged range
-                            if value is None:
-                                for merged_range in merged_ranges:
-                                    if cell.coordinate in merged_range:
-                                        # Get the top-left cell value
-                                        top_left = ws.cell(row=merged_range.min_row, column=merged_range.min_col)
-                                        value = top_left.value
-                                        break
-                            
-                            # Format numeric values to 2 decimal places
-                            if isinstance(value, (int, float)) and not isinstance(value, bool):
-                                if abs(value) < 1e-10:  # Very small numbers
-                                    value = 0.0
-                                else:
-                                    value = round(float(value), 2)
-                            
-                            row_data.append(value if value is not None else '')
-                        all_rows.append(row_data)
-                    
-                    # Extract headers (first 2 rows for merged headers)
-                    if len(all_rows) >= 2:
-                        header_row1 = all_rows[0]
-                        header_row2 = all_rows[1]
-                        
-                        # Find merged ranges that span row 1-2
-                        merged_cols = {}  # Track which columns are part of merged ranges
-                        for merged_range in merged_ranges:
-                            if merged_range.min_row == 1 and merged_range.max_row == 2:
-                                # This is a vertical merge spanning both header rows
-                                for col in range(merged_range.min_col, merged_range.max_col + 1):
-                                    merged_cols[col - 1] = merged_range.min_col - 1  # Store reference to first column
-                        
-                        # Combine headers for merged cells
-                        headers = []
-                        current_main_header = None
-                        
-                        for i in range(len(header_row1)):
-                            h1 = header_row1[i] if header_row1[i] else ''
-                            h2 = header_row2[i] if i < len(header_row2) and header_row2[i] else ''
-                            
-                            # Check if this column is part of a horizontal merge in row 1
-                            is_merged_horizontal = False
-                            for merged_range in merged_ranges:
-                                if merged_range.min_row == 1 and merged_range.max_row == 1:
-                                    if merged_range.min_col <= i + 1 <= merged_range.max_col:
-                                        is_merged_horizontal = True
-                                        if merged_range.min_col == i + 1:
-                                            current_main_header = h1
-                                        break
-                            
-                            # If column is part of horizontal merge, use main header
-                            if is_merged_horizontal and current_main_header:
-                                if h2:
-                                    headers.append(f"{current_main_header} - {h2}")
-                                else:
-                                    headers.append(current_main_header)
-                            # If column is part of vertical merge, use row 1 value
-                            elif i in merged_cols:
-                                ref_col = merged_cols[i]
-                                h1_ref = header_row1[ref_col] if ref_col < len(header_row1) else ''
-                                headers.append(h1_ref if h1_ref else h1)
-                            # Normal case: combine both rows if both have values
-                            elif h1 and h2:
-                                headers.append(f"{h1} - {h2}")
-                            elif h1:
-                                headers.append(h1)
-                            elif h2:
-                                headers.append(h2)
-                            else:
-                                headers.append(f"Column {i+1}")
-                        
-                        # Data rows start from row 3 (index 2)
-                        data_rows = all_rows[2:] if len(all_rows) > 2 else []
-                    else:
-                        headers = [f"Column {i+1}" for i in range(max_col)]
-                        data_rows = all_rows[1:] if len(all_rows) > 1 else []
-                    
-                    dataset_sheets[sheet_name] = {
-                        'columns': headers,
-                        'data': data_rows
-                    }
-                
+            jobs[dataset_name] = excel_file_path
+
+        if not jobs:
+            return excel_data
+
+        # Reuse sheets extracted by an earlier run while the workbook is unchanged
+        cached = {}
+        if self.use_cache:
+            self.cache_dir.mkdir(exist_ok=True)
+            for dataset_name, excel_file_path in jobs.items():
+                try:
+                    with open(self.sheet_cache_path(excel_file_path), 'rb') as f:
+                        cached[dataset_name] = pickle.load(f)
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    pass
+        pending = [name for name in jobs if name not in cached]
+
+        # Workbooks are independent, so parse them in parallel worker processes;
+        # a fully cached run starts no pool at all
+        executor = ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) if pending else None
+        try:
+            futures = {name: executor.submit(_extract_one, jobs[name], self.export_sheets) for name in pending}
+            for dataset_name in jobs:
+                if dataset_name in cached:
+                    excel_data[dataset_name] = cached[dataset_name]
+                    print(f"    ✅ Loaded cached data for {dataset_name} ({len(cached[dataset_name])} sheets)")
+                    continue
+
+                try:
+                    dataset_sheets = futures[dataset_name].result()
+                except Exception as e:
+                    print(f"    ⚠️ Error extracting Excel data for {dataset_name}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    continue
+
                 excel_data[dataset_name] = dataset_sheets
-                print(f"    ✅ Extracted data from {dataset_name} ({len(wb.sheetnames)} sheets)")
-                
-            except Exception as e:
-                print(f"    ⚠️ Error extracting Excel data for {dataset_name}: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
+                print(f"    ✅ Extracted data from {dataset_name} ({len(dataset_sheets)} sheets)")
+
+                if self.use_cache:
+                    try:
+                        with open(self.sheet_cache_path(jobs[dataset_name]), 'wb') as f:
+                            pickle.dump(dataset_sheets, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    except OSError as e:
+                        print(f"    ⚠️ Could not cache Excel data for {dataset_name}: {e}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
         
         return excel_data
 
+    def sheet_cache_path(self, excel_file_path):
+        """Cache file for one workbook's extracted sheets; changes with the workbook, this script, or export_sheets."""
+        st = Path(excel_file_path).stat()
+        sheets = sorted(self.export_sheets) if self.export_sheets else None
+        key = repr((str(Path(excel_file_path).resolve()), st.st_mtime_ns, st.st_size,
+                    os.stat(__file__).st_mtime_ns, sheets))
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
+    def _write_json(self, path, obj):
+        """Write ``obj`` as compact JSON, with orjson when it is installed."""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(path, 'w') as f:
+                json.dump(obj, f, separators=(',', ':'))
+
     def save_json_data(self):
         """Save all data as JSON for the web interface."""
         print("\n💾 Saving JSON data...")
@@ -370,6 +574,15 @@ class LeaderboardGenerator:
         # Extract Excel data for dataset detail views
         excel_data = self.extract_excel_data()
 
+        # Dataset sheet tables go to one file per dataset so the main JSON stays small;
+        # the web interface fetches a dataset's file (listed in excel_data_files) when it is opened
+        sheets_dir = self.output_dir / 'sheets'
+        sheets_dir.mkdir(exist_ok=True)
+        excel_data_files = {}
+        for dataset_name, dataset_sheets in excel_data.items():
+            excel_data_files[dataset_name] = f"sheets/{dataset_name}.json"
+            self._write_json(self.output_dir / excel_data_files[dataset_name], dataset_sheets)
+
         # Prepare final data structure
         final_data = {
             'metadata': {
@@ -381,15 +594,17 @@ class LeaderboardGenerator:
             'mlips': self.leaderboard_data,
             'datasets': self.dataset_info,
             'rankings': rankings,
-            'excel_data': excel_data
+            'excel_data_files': excel_data_files
         }
 
-        # Save to JSON file
+        # Save to JSON file (compact; it is a build artifact read by the web app)
         json_path = self.output_dir / 'leaderboard_data.json'
-        with open(json_path, 'w') as f:
-            json.dump(final_data, f, indent=2)
+        self._write_json(json_path, final_data)
 
         print(f"  ✅ Saved data to {json_path}")
+        print(f"  ✅ Saved Excel data for {len(excel_data_files)} datasets to {sheets_dir}")
+
+        final_data['excel_data'] = excel_data
 
         return final_data
 
@@ -458,6 +673,10 @@ class LeaderboardGenerator:
         # Calculate aggregates
         self.calculate_aggregate_metrics()
 
+        # The dataset view only renders the per-MLIP sheets
+        if self.export_sheets is None:
+            self.export_sheets = set(self.leaderboard_data)
+
         # Save JSON data
         data = self.save_json_data()
 
@@ -472,7 +691,12 @@ class LeaderboardGenerator:
 
 def main():
     """Main entry point."""
-    generator = LeaderboardGenerator()
+    parser = argparse.ArgumentParser(description="Generate CatBench leaderboard data from benchmark results.")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="re-extract every workbook instead of reusing cached sheet data")
+    args = parser.parse_args()
+
+    generator = LeaderboardGenerator(use_cache=not args.no_cache)
     generator.run()
 
 
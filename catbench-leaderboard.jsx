@@ -78,6 +78,33 @@ const CatBenchLeaderboard = ({ data }) => {
     return getDatasetInfo(data, selectedDataset);
   }, [data, selectedDataset]);
 
+  // per-MLIP sheets of opened datasets, fetched from their sidecar files on demand
+  const [loadedExcelData, setLoadedExcelData] = useState({});
+
+  React.useEffect(() => {
+    const sheetsFile = data?.excel_data_files?.[selectedDataset];
+    if (!sheetsFile || loadedExcelData[selectedDataset]) return;
+    fetch(`${import.meta.env.BASE_URL}${sheetsFile}`)
+      .then(response => {
+        if (!response.ok) {
+          throw new Error(`Unable to fetch sheet data for ${selectedDataset}.`);
+        }
+        return response.json();
+      })
+      .then(sheets => {
+        setLoadedExcelData(prev => ({ ...prev, [selectedDataset]: sheets }));
+      })
+      .catch(err => {
+        console.error('Sheet data load error:', err);
+      });
+  }, [data, selectedDataset, loadedExcelData]);
+
+  // leaderboard data with the fetched sheets merged into excel_data
+  const dataWithSheets = useMemo(() => {
+    if (!data) return data;
+    return { ...data, excel_data: { ...(data.excel_data || {}), ...loadedExcelData } };
+  }, [data, loadedExcelData]);
+
   // filter current dataset by search query
   const filteredData = useMemo(() => {
     if (!searchQuery.trim()) return currentData;
@@ -918,7 +945,7 @@ const CatBenchLeaderboard = ({ data }) => {
             
             // fetch adsorbate-level metrics using the currently selected dataset
             const adsorbateData = selectedDataset 
-              ? getDatasetMlipAdsorbateBreakdown(data, selectedDataset, selectedModel)
+              ? getDatasetMlipAdsorbateBreakdown(dataWithSheets, selectedDataset, selectedModel)
               : getAdsorbateBreakdown(data, selectedModel);
             
             return (
@@ -1455,7 +1482,7 @@ const CatBenchLeaderboard = ({ data }) => {
             
             // fetch adsorbate-level metrics using the currently selected dataset
             const adsorbateData = selectedDataset 
-              ? getDatasetMlipAdsorbateBreakdown(data, selectedDataset, selectedModel)
+              ? getDatasetMlipAdsorbateBreakdown(dataWithSheets, selectedDataset, selectedModel)
               : getAdsorbateBreakdown(data, selectedModel);
             
             return (
@@ -5,15 +5,253 @@ This script aggregates benchmark results from multiple datasets and generates
 an interactive leaderboard website for React deployment.
 """
 
+import io
 import json
+import os
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import warnings
 import openpyxl
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib json encoder is used otherwise
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel below runs as plain numpy
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    # python-calamine is optional; workbooks are then read with openpyxl
+    CalamineWorkbook = None
+
+# Summary sheets are not part of the per-MLIP dataset views
+SUMMARY_SHEETS = {'mlip_data', 'anomaly_analysis', 'summary', 'anomaly'}
+
+# Alternative MLIP_Data column names for each key metric, in order of preference
+COLUMN_ALIASES = {
+    'MAE_total (eV)': ['MAE_total (eV)', 'MAE_total', 'MAE_total(eV)'],
+    'MAE_normal (eV)': ['MAE_normal (eV)', 'MAE_normal', 'MAE_normal(eV)'],
+    'Normal rate (%)': ['Normal rate (%)', 'Normal rate', 'Normal rate(%)', 'Normal (%)'],
+    'ADwT (%)': ['ADwT (%)', 'ADwT', 'ADwT(%)'],
+    'Time_per_step (s)': ['Time_per_step (s)', 'Time_per_step', 'Time/step (s)', 'Time/step']
+}
+
+
+@njit(cache=True)
+def _stats(v, w):
+    """Return ``(mean, std, min, max, weighted_mean)`` of ``v``, weighting by ``w``.
+
+    The weighted mean falls back to the plain mean when the weights sum to zero.
+    """
+    mean = v.mean()
+    w_sum = w.sum()
+    weighted_mean = (v * w).sum() / w_sum if w_sum > 0 else mean
+    return mean, v.std(), v.min(), v.max(), weighted_mean
+
+
+def _find_benchmarks(root):
+    """Yield the ``<dataset>/<dataset>_Benchmarking_Analysis.xlsx`` files under ``root``."""
+    if not os.path.isdir(root):
+        return
+    with os.scandir(root) as entries:
+        for entry in entries:
+            # Skip hidden entries, as the '*' glob pattern did
+            if entry.name.startswith('.') or not entry.is_dir():
+                continue
+            path = os.path.join(entry.path, f"{entry.name}_Benchmarking_Analysis.xlsx")
+            if os.path.exists(path):
+                yield Path(path)
+
+
+def read_workbook_sheets(excel_file_path):
+    """Read the MLIP_Data sheet and the per-MLIP sheets of a benchmark workbook.
+
+    Returns ``(mlip_rows, sheets)``: the raw rows of the MLIP_Data sheet, and a list of
+    ``(sheet_name, rows, merged_ranges)`` for every non-summary sheet. ``rows`` holds
+    the raw cell values (None for empty cells) and ``merged_ranges`` holds 1-based
+    ``(min_row, min_col, max_row, max_col)`` tuples.
+
+    Uses python-calamine when it is installed, falling back to openpyxl for the whole
+    workbook otherwise, or just for the merged ranges calamine cannot report.
+    """
+    if CalamineWorkbook is None:
+        return _read_workbook_sheets_openpyxl(excel_file_path)
+
+    wb = CalamineWorkbook.from_path(str(excel_file_path))
+    mlip_rows = None
+    sheets = []
+    openpyxl_wb = None  # loaded only if calamine has no merged-range metadata
+
+    for sheet_name in wb.sheet_names:
+        if sheet_name != 'MLIP_Data' and sheet_name.lower() in SUMMARY_SHEETS:
+            continue
+
+        sheet = wb.get_sheet_by_name(sheet_name)
+        # calamine reports empty cells as '' and would otherwise trim leading empty rows/columns
+        rows = [[None if value == '' else value for value in row]
+                for row in sheet.to_python(skip_empty_area=False)]
+
+        if sheet_name == 'MLIP_Data':
+            mlip_rows = rows
+            continue
+
+        # merged_cell_ranges is missing from older python-calamine releases and
+        # None for formats without merge metadata
+        merged = getattr(sheet, 'merged_cell_ranges', None)
+        if merged is not None:
+            merged_ranges = [(r0 + 1, c0 + 1, r1 + 1, c1 + 1) for (r0, c0), (r1, c1) in merged]
+        else:
+            if openpyxl_wb is None:
+                openpyxl_wb = openpyxl.load_workbook(excel_file_path, data_only=True)
+            merged_ranges = [(mr.min_row, mr.min_col, mr.max_row, mr.max_col)
+                             for mr in openpyxl_wb[sheet_name].merged_cells.ranges]
+
+        sheets.append((sheet_name, rows, merged_ranges))
+
+    if mlip_rows is None:
+        raise ValueError("Worksheet named 'MLIP_Data' not found")
+
+    return mlip_rows, sheets
+
+
+def _read_workbook_sheets_openpyxl(excel_file_path):
+    """openpyxl version of ``read_workbook_sheets``.
+
+    Values are streamed from a read-only workbook. Read-only worksheets do not
+    expose merged ranges, so those come from a second, regular load.
+    """
+    wb = openpyxl.load_workbook(excel_file_path, data_only=True, read_only=True)
+    merged_wb = None  # loaded only if there is a per-MLIP sheet
+    mlip_rows = None
+    sheets = []
+
+    try:
+        for sheet_name in wb.sheetnames:
+            if sheet_name != 'MLIP_Data' and sheet_name.lower() in SUMMARY_SHEETS:
+                continue
+
+            rows = [list(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+
+            if sheet_name == 'MLIP_Data':
+                mlip_rows = rows
+                continue
+
+            if merged_wb is None:
+                merged_wb = openpyxl.load_workbook(excel_file_path, data_only=True)
+            merged_ranges = [(mr.min_row, mr.min_col, mr.max_row, mr.max_col)
+                             for mr in merged_wb[sheet_name].merged_cells.ranges]
+            sheets.append((sheet_name, rows, merged_ranges))
+    finally:
+        # Read-only workbooks keep the file open until closed
+        wb.close()
+
+    if mlip_rows is None:
+        raise ValueError("Worksheet named 'MLIP_Data' not found")
+
+    return mlip_rows, sheets
+
+
+# Elementwise "is a numeric cell value" test (bools are not numbers here)
+_is_number = np.frompyfunc(lambda v: isinstance(v, (int, float)) and not isinstance(v, bool), 1, 1)
+
+
+def _merge_header(h1, h2, i):
+    """Combine the two header cells of column ``i`` into one column name."""
+    # Special handling for Anomaly count columns: one column per detection scheme
+    if h1 == 'Anomaly count':
+        return f"Anomaly count - {h2}" if h2 else 'Anomaly count - total'
+    if h1 and h2 and h1 != h2:
+        return f"{h1} - {h2}"
+    return h1 or h2 or f"Column {i+1}"
+
+
+def build_sheet_data(rows, merged_ranges):
+    """Build the ``{'columns', 'data'}`` view of a per-MLIP sheet, or None if it is empty."""
+    if not rows:
+        return None
+    
+    # Lay the sheet out as one object array (short rows are padded with None)
+    n_rows = len(rows)
+    n_cols = max(len(row) for row in rows)
+    arr = np.empty((n_rows, n_cols), dtype=object)
+    for row_idx, row in enumerate(rows):
+        arr[row_idx, :len(row)] = row
+    
+    # Map every cell covered by a merged range to the range's top-left value,
+    # clipped to the sheet's extent (the first range listed wins on overlap)
+    merged_lookup = {}
+    for min_row, min_col, max_row, max_col in merged_ranges:
+        if min_row > n_rows or min_col > n_cols:
+            continue
+        top_left = arr[min_row - 1, min_col - 1]
+        for r in range(min_row, min(max_row, n_rows) + 1):
+            for c in range(min_col, min(max_col, n_cols) + 1):
+                merged_lookup.setdefault((r, c), top_left)
+    
+    # Fill empty cells that are part of a merged range
+    for (r, c), value in merged_lookup.items():
+        if arr[r - 1, c - 1] is None:
+            arr[r - 1, c - 1] = value
+    arr[np.equal(arr, None)] = ''
+    
+    # Format numeric values in one pass over the whole sheet
+    num_mask = _is_number(arr).astype(bool)
+    nums = arr[num_mask].astype(np.float64)
+    nums[np.abs(nums) < 1e-10] = 0.0  # Very small numbers
+    arr[num_mask] = nums.tolist()
+    
+    # Extract headers (first row or first 2 rows for merged headers); only the
+    # first two rows are inspected, the rest go straight into data_rows
+    header_row = arr[0].tolist()
+    second_row = arr[1].tolist() if n_rows >= 2 else None
+    
+    # If second row has mostly text/headers, combine
+    if second_row is not None and any(isinstance(v, str) and v.strip() for v in second_row[:5]):
+        h1s = [str(x) if x else '' for x in header_row]
+        h2s = [str(x) if x else '' for x in second_row + [None] * (len(header_row) - len(second_row))]
+        headers = [_merge_header(h1, h2, i) for i, (h1, h2) in enumerate(zip(h1s, h2s))]
+        data_rows = arr[2:].tolist()
+    else:
+        headers = [str(h) if h else f"Column {i+1}" for i, h in enumerate(header_row)]
+        data_rows = arr[1:].tolist()
+    
+    return {
+        'columns': headers,
+        'data': data_rows
+    }
+
+
+def _parse_one_file(excel_path):
+    """Parse one benchmark workbook into ``(dataset_name, mlip_df, sheets_dict)``.
+
+    Runs in worker processes, so it only depends on its argument.
+    """
+    mlip_rows, sheets = read_workbook_sheets(excel_path)
+    mlip_df = pd.DataFrame(mlip_rows[1:], columns=mlip_rows[0])
+
+    sheets_dict = {}
+    for sheet_name, rows, merged_ranges in sheets:
+        sheet_data = build_sheet_data(rows, merged_ranges)
+        if sheet_data is not None:
+            sheets_dict[sheet_name] = sheet_data
+
+    return Path(excel_path).parent.name, mlip_df, sheets_dict
+
 
 class LeaderboardGenerator:
     """Generate leaderboard data from CatBench benchmark results."""
@@ -37,21 +275,32 @@ class LeaderboardGenerator:
         self.dataset_info = {}
         self.mlip_info = {}
 
+        # Per-MLIP sheet views parsed during collection, keyed by dataset name
+        self._sheets_cache = {}
+
     def collect_benchmark_data(self):
         """Collect all benchmark data from Excel files."""
         print("📊 Collecting benchmark data...")
 
         # Find all Excel files
-        excel_files = list(self.results_dir.glob('*/*_Benchmarking_Analysis.xlsx'))
+        excel_files = list(_find_benchmarks(self.results_dir))
         print(f"Found {len(excel_files)} benchmark files")
 
-        for excel_file in excel_files:
+        if not excel_files:
+            return
+
+        # Parse the workbooks in parallel, then fold the results in file order
+        with ProcessPoolExecutor(max_workers=min(len(excel_files), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(_parse_one_file, str(excel_file)) for excel_file in excel_files]
+
+        for excel_file, future in zip(excel_files, futures):
             dataset_name = excel_file.parent.name
             print(f"  Processing {dataset_name}...")
 
             try:
-                # Read MLIP_Data sheet
-                df = pd.read_excel(excel_file, sheet_name='MLIP_Data')
+                # Read MLIP_Data and keep the per-MLIP sheets for extract_excel_data
+                _, df, sheets_dict = future.result()
+                self._sheets_cache[dataset_name] = sheets_dict
 
                 # Clean the dataframe (remove NaN rows)
                 df = df.dropna(subset=['MLIP_name'])
@@ -67,13 +316,26 @@ class LeaderboardGenerator:
                     self.dataset_info[dataset_name] = {
                         'name': dataset_name,
                         'num_structures': num_total,
-                        'file_path': str(excel_file.absolute())  # Store absolute path
+                        'file_path': str(excel_file.resolve())  # Store absolute path
                     }
 
-                # Process each MLIP
-                for _, row in df.iterrows():
-                    mlip_name = row['MLIP_name']
+                # Normalize alternative column names to the canonical metric names
+                renames = {}
+                for canonical, aliases in COLUMN_ALIASES.items():
+                    if canonical not in df.columns:
+                        found = next((alias for alias in aliases if alias in df.columns), None)
+                        if found is not None:
+                            renames[found] = canonical
+                df = df.rename(columns=renames)
+
+                metric_columns = [m for m in self.key_metrics if m in df.columns]
+                mlip_names = df['MLIP_name'].to_numpy()
+                metric_values = df[metric_columns].to_numpy(dtype=np.float64)
+                # Which metric cells are present, checked once for the whole table
+                metric_mask = ~np.isnan(metric_values)
 
+                # Process each MLIP
+                for mlip_name, row_values, row_mask in zip(mlip_names, metric_values.tolist(), metric_mask.tolist()):
                     # Initialize MLIP data structure
                     if mlip_name not in self.leaderboard_data:
                         self.leaderboard_data[mlip_name] = {
@@ -82,26 +344,7 @@ class LeaderboardGenerator:
                         }
 
                     # Store metrics for this dataset
-                    metrics = {}
-                    for metric in self.key_metrics:
-                        # Handle different column name formats
-                        metric_key = metric
-                        if metric_key not in row:
-                            # Try alternative names
-                            alt_names = {
-                                'MAE_total (eV)': ['MAE_total (eV)', 'MAE_total', 'MAE_total(eV)'],
-                                'MAE_normal (eV)': ['MAE_normal (eV)', 'MAE_normal', 'MAE_normal(eV)'],
-                                'Normal rate (%)': ['Normal rate (%)', 'Normal rate', 'Normal rate(%)', 'Normal (%)'],
-                                'ADwT (%)': ['ADwT (%)', 'ADwT', 'ADwT(%)'],
-                                'Time_per_step (s)': ['Time_per_step (s)', 'Time_per_step', 'Time/step (s)', 'Time/step']
-                            }
-                            for alt in alt_names.get(metric_key, []):
-                                if alt in row and pd.notna(row[alt]):
-                                    metric_key = alt
-                                    break
-                        
-                        if metric_key in row and pd.notna(row[metric_key]):
-                            metrics[metric] = float(row[metric_key])
+                    metrics = {m: v for m, v, present in zip(metric_columns, row_values, row_mask) if present}
 
                     self.leaderboard_data[mlip_name]['datasets'][dataset_name] = metrics
 
@@ -135,28 +378,20 @@ class LeaderboardGenerator:
                         weights.append(dataset_size)
 
                 if values:
-                    # For MAE metrics, use weighted average (larger datasets have more weight)
-                    if 'MAE' in metric:
-                        if sum(weights) > 0:
-                            weighted_mean = sum(v * w for v, w in zip(values, weights)) / sum(weights)
-                        else:
-                            weighted_mean = float(np.mean(values))
-                        avg_metrics[metric] = {
-                            'mean': weighted_mean,
-                            'std': float(np.std(values)),
-                            'min': float(np.min(values)),
-                            'max': float(np.max(values)),
-                            'count': len(values)
-                        }
-                    else:
-                        # For other metrics, use simple average
-                        avg_metrics[metric] = {
-                            'mean': float(np.mean(values)),
-                            'std': float(np.std(values)),
-                            'min': float(np.min(values)),
-                            'max': float(np.max(values)),
-                            'count': len(values)
-                        }
+                    v = np.fromiter(values, dtype=np.float64, count=len(values))
+                    w = np.fromiter(weights, dtype=np.float64, count=len(weights))
+
+                    mean, std, v_min, v_max, weighted_mean = _stats(v, w)
+
+                    avg_metrics[metric] = {
+                        # For MAE metrics, use weighted average (larger datasets have more weight);
+                        # for other metrics, use simple average
+                        'mean': float(weighted_mean if 'MAE' in metric else mean),
+                        'std': float(std),
+                        'min': float(v_min),
+                        'max': float(v_max),
+                        'count': len(values)
+                    }
 
             mlip_data['average_metrics'] = avg_metrics
 
@@ -185,61 +420,46 @@ class LeaderboardGenerator:
         """Generate rankings for different metrics."""
         print("\n🏆 Generating rankings...")
 
-        rankings = {
-            'overall': [],
-            'accuracy': [],
-            'success_rate': [],
-            'speed': [],
-            'coverage': []
+        # One row of aggregate metrics per MLIP; missing metrics become NaN
+        ranking_metrics = {
+            'mae': 'MAE_total (eV)',
+            'rate': 'Normal rate (%)',
+            'time': 'Time_per_step (s)'
         }
-
-        # Overall ranking (by composite score)
+        records = []
         for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'overall_score' in mlip_data:
-                rankings['overall'].append({
-                    'mlip': mlip_name,
-                    'score': mlip_data['overall_score'],
-                    'num_datasets': mlip_data['num_datasets']
-                })
-        rankings['overall'].sort(key=lambda x: x['score'], reverse=True)
-
-        # Accuracy ranking (by MAE)
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'average_metrics' in mlip_data and 'MAE_total (eV)' in mlip_data['average_metrics']:
-                rankings['accuracy'].append({
-                    'mlip': mlip_name,
-                    'mae': mlip_data['average_metrics']['MAE_total (eV)']['mean'],
-                    'std': mlip_data['average_metrics']['MAE_total (eV)']['std']
-                })
-        rankings['accuracy'].sort(key=lambda x: x['mae'])
-
-        # Success rate ranking
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'average_metrics' in mlip_data and 'Normal rate (%)' in mlip_data['average_metrics']:
-                rankings['success_rate'].append({
-                    'mlip': mlip_name,
-                    'rate': mlip_data['average_metrics']['Normal rate (%)']['mean'],
-                    'std': mlip_data['average_metrics']['Normal rate (%)']['std']
-                })
-        rankings['success_rate'].sort(key=lambda x: x['rate'], reverse=True)
-
-        # Speed ranking
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            if 'average_metrics' in mlip_data and 'Time_per_step (s)' in mlip_data['average_metrics']:
-                rankings['speed'].append({
-                    'mlip': mlip_name,
-                    'time': mlip_data['average_metrics']['Time_per_step (s)']['mean'],
-                    'std': mlip_data['average_metrics']['Time_per_step (s)']['std']
-                })
-        rankings['speed'].sort(key=lambda x: x['time'])
-
-        # Coverage ranking (number of datasets tested)
-        for mlip_name, mlip_data in self.leaderboard_data.items():
-            rankings['coverage'].append({
+            avg_metrics = mlip_data.get('average_metrics', {})
+            record = {
                 'mlip': mlip_name,
-                'count': mlip_data['num_datasets']
-            })
-        rankings['coverage'].sort(key=lambda x: x['count'], reverse=True)
+                'score': mlip_data.get('overall_score'),
+                'num_datasets': mlip_data.get('num_datasets')
+            }
+            for key, metric in ranking_metrics.items():
+                record[key] = avg_metrics.get(metric, {}).get('mean')
+                record[f'{key}_std'] = avg_metrics.get(metric, {}).get('std')
+            records.append(record)
+
+        agg_df = pd.DataFrame.from_records(records, columns=[
+            'mlip', 'score', 'num_datasets', 'mae', 'mae_std', 'rate', 'rate_std', 'time', 'time_std'
+        ])
+
+        def ranked(by, ascending, columns):
+            # Stable sort, so ties keep the leaderboard order
+            ranked_df = agg_df.dropna(subset=[by]).sort_values(by, ascending=ascending, kind='stable')
+            return ranked_df[list(columns)].rename(columns=columns).to_dict(orient='records')
+
+        rankings = {
+            # Overall ranking (by composite score)
+            'overall': ranked('score', False, {'mlip': 'mlip', 'score': 'score', 'num_datasets': 'num_datasets'}),
+            # Accuracy ranking (by MAE)
+            'accuracy': ranked('mae', True, {'mlip': 'mlip', 'mae': 'mae', 'mae_std': 'std'}),
+            # Success rate ranking
+            'success_rate': ranked('rate', False, {'mlip': 'mlip', 'rate': 'rate', 'rate_std': 'std'}),
+            # Speed ranking
+            'speed': ranked('time', True, {'mlip': 'mlip', 'time': 'time', 'time_std': 'std'}),
+            # Coverage ranking (number of datasets tested)
+            'coverage': ranked('num_datasets', False, {'mlip': 'mlip', 'num_datasets': 'count'})
+        }
 
         return rankings
 
@@ -250,136 +470,33 @@ class LeaderboardGenerator:
         excel_data = {}
         adsorbate_breakdown = {}
         
-        for dataset_name, dataset_info in self.dataset_info.items():
-            excel_file_path = Path(dataset_info['file_path'])
-            
-            # Ensure absolute path
-            if not excel_file_path.is_absolute():
-                # Try relative to current directory first
-                if (Path.cwd() / excel_file_path).exists():
-                    excel_file_path = Path.cwd() / excel_file_path
-                # Then try relative to results_dir
-                elif (self.results_dir / dataset_name / f"{dataset_name}_Benchmarking_Analysis.xlsx").exists():
-                    excel_file_path = self.results_dir / dataset_name / f"{dataset_name}_Benchmarking_Analysis.xlsx"
-                else:
-                    print(f"    ⚠️ Excel file not found: {excel_file_path}")
-                    continue
-            
-            if not excel_file_path.exists():
-                print(f"    ⚠️ Excel file not found: {excel_file_path}")
-                continue
-            
-            try:
-                # Read Excel file with openpyxl to handle merged cells
-                wb = openpyxl.load_workbook(excel_file_path, data_only=True)
-                dataset_sheets = {}
-                
-                for sheet_name in wb.sheetnames:
-                    ws = wb[sheet_name]
-                    
-                    # Skip summary sheets
-                    if sheet_name.lower() in ['mlip_data', 'anomaly_analysis', 'summary', 'anomaly']:
-                        continue
-                    
-                    # Process merged cells to create proper headers
-                    merged_ranges = list(ws.merged_cells.ranges)
-                    
-                    # Read all rows
-                    all_rows = []
-                    max_row = ws.max_row
-                    max_col = ws.max_column
-                    
-                    for row_idx in range(1, max_row + 1):
-                        row_data = []
-                        for col_idx in range(1, max_col + 1):
-                            cell = ws.cell(row=row_idx, column=col_idx)
-                            value = cell.value
-                            
-                            # Check if cell is part of a merged range
-                            if value is None:
-                                for merged_range in merged_ranges:
-                                    if cell.coordinate in merged_range:
-                                        # Get the top-left cell value
-                                        top_left = ws.cell(row=merged_range.min_row, column=merged_range.min_col)
-                                        value = top_left.value
-                                        break
-                            
-                            # Format numeric values
-                            if isinstance(value, (int, float)) and not isinstance(value, bool):
-                                if abs(value) < 1e-10:  # Very small numbers
-                                    value = 0.0
-                                else:
-                                    value = float(value)
-                            
-                            row_data.append(value if value is not None else '')
-                        all_rows.append(row_data)
-                    
-                    # Extract headers (first row or first 2 rows for merged headers)
-                    if len(all_rows) >= 1:
-                        # Try to detect if first row is header
-                        header_row = all_rows[0]
-                        
-                        # Check if second row might be part of header
-                        if len(all_rows) >= 2:
-                            second_row = all_rows[1]
-                            # If second row has mostly text/headers, combine
-                            if any(isinstance(v, str) and v.strip() for v in second_row[:5]):
-                                headers = []
-                                for i in range(len(header_row)):
-                                    h1 = str(header_row[i]) if header_row[i] else ''
-                                    h2 = str(second_row[i]) if i < len(second_row) and second_row[i] else ''
-                                    
-                                    # Special handling for Anomaly count columns
-                                    if h1 == 'Anomaly count' and h2:
-                                        # Create separate columns for each detection scheme
-                                        headers.append(f"Anomaly count - {h2}")
-                                    elif h1 == 'Anomaly count' and not h2:
-                                        headers.append('Anomaly count - total')
-                                    elif h1 and h2 and h1 != h2:
-                                        headers.append(f"{h1} - {h2}")
-                                    elif h1:
-                                        headers.append(h1)
-                                    elif h2:
-                                        headers.append(h2)
-                                    else:
-                                        headers.append(f"Column {i+1}")
-                                data_rows = all_rows[2:] if len(all_rows) > 2 else []
-                            else:
-                                headers = [str(h) if h else f"Column {i+1}" for i, h in enumerate(header_row)]
-                                data_rows = all_rows[1:] if len(all_rows) > 1 else []
-                        else:
-                            headers = [str(h) if h else f"Column {i+1}" for i, h in enumerate(header_row)]
-                            data_rows = []
-                        
-                        # Store sheet data (all sheets including MLIP-specific ones)
-                        dataset_sheets[sheet_name] = {
-                            'columns': headers,
-                            'data': data_rows
-                        }
-                        
-                        # Extract adsorbate breakdown for MLIP-specific sheets
-                        # MLIP sheet names are typically the MLIP name itself
-                        # Check if this sheet name matches any known MLIP name
-                        mlip_name = sheet_name
-                        # Store in adsorbate_breakdown for backward compatibility
-                        # (use first dataset's data for each MLIP, or merge if needed)
-                        if mlip_name not in adsorbate_breakdown:
-                            adsorbate_breakdown[mlip_name] = {
-                                'columns': headers,
-                                'data': data_rows
-                            }
-                
-                excel_data[dataset_name] = dataset_sheets
-                print(f"    ✅ Extracted data from {dataset_name} ({len(wb.sheetnames)} sheets)")
-                
-            except Exception as e:
-                print(f"    ⚠️ Error extracting Excel data for {dataset_name}: {e}")
-                import traceback
-                traceback.print_exc()
-                continue
+        # collect_benchmark_data caches the sheets of every dataset it records
+        for dataset_name in self.dataset_info:
+            dataset_sheets = self._sheets_cache[dataset_name]
+            excel_data[dataset_name] = dataset_sheets
+            print(f"    ✅ Extracted data from {dataset_name} ({len(dataset_sheets)} MLIP sheets)")
+        
+        # Adsorbate breakdown for backward compatibility: MLIP sheet names are the
+        # MLIP names themselves, and the first dataset's sheet for each MLIP is used
+        for dataset_sheets in excel_data.values():
+            for mlip_name, sheet_data in dataset_sheets.items():
+                adsorbate_breakdown.setdefault(mlip_name, sheet_data)
         
         return excel_data, adsorbate_breakdown
 
+    def _write_json(self, path, obj):
+        """Write ``obj`` as indented UTF-8 JSON, with orjson when it is installed."""
+        if orjson is not None:
+            # orjson always writes UTF-8, matching ensure_ascii=False below
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(
+                    obj,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(obj, f, indent=2, ensure_ascii=False)
+
     def save_json_data(self):
         """Save all data as JSON for the web interface."""
         print("\n💾 Saving JSON data...")
@@ -390,6 +507,15 @@ class LeaderboardGenerator:
         # Extract Excel data for dataset detail views and adsorbate breakdown
         excel_data, adsorbate_breakdown = self.extract_excel_data()
 
+        # Dataset sheet views make up most of the data, so each dataset's sheets go
+        # to their own file, fetched by the web interface when the dataset is opened
+        sheets_dir = self.output_dir / 'sheets'
+        sheets_dir.mkdir(exist_ok=True)
+        excel_data_files = {}
+        for dataset_name, dataset_sheets in excel_data.items():
+            excel_data_files[dataset_name] = f"sheets/{dataset_name}.json"
+            self._write_json(self.output_dir / excel_data_files[dataset_name], dataset_sheets)
+
         # Prepare final data structure
         final_data = {
             'metadata': {
@@ -401,16 +527,16 @@ class LeaderboardGenerator:
             'mlips': self.leaderboard_data,
             'datasets': self.dataset_info,
             'rankings': rankings,
-            'excel_data': excel_data,
+            'excel_data_files': excel_data_files,
             'adsorbate_breakdown': adsorbate_breakdown
         }
 
         # Save to JSON file
         json_path = self.output_dir / 'leaderboard_data.json'
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(final_data, f, indent=2, ensure_ascii=False)
+        self._write_json(json_path, final_data)
 
         print(f"  ✅ Saved data to {json_path}")
+        print(f"     - {len(excel_data_files)} dataset sheet files in {sheets_dir}")
         print(f"     - {len(self.leaderboard_data)} MLIPs")
         print(f"     - {len(self.dataset_info)} datasets")
         print(f"     - {len(adsorbate_breakdown)} MLIPs with adsorbate breakdown")
@@ -421,55 +547,57 @@ class LeaderboardGenerator:
         """Generate a text summary report."""
         print("\n📝 Generating summary report...")
 
-        report = []
-        report.append("=" * 80)
-        report.append("CATBENCH LEADERBOARD SUMMARY")
-        report.append("=" * 80)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"Total MLIPs evaluated: {data['metadata']['num_mlips']}")
-        report.append(f"Total datasets: {data['metadata']['num_datasets']}")
-        report.append("")
+        buf = io.StringIO()
+        print("=" * 80, file=buf)
+        print("CATBENCH LEADERBOARD SUMMARY", file=buf)
+        print("=" * 80, file=buf)
+        print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=buf)
+        print(f"Total MLIPs evaluated: {data['metadata']['num_mlips']}", file=buf)
+        print(f"Total datasets: {data['metadata']['num_datasets']}", file=buf)
+        print(file=buf)
 
         # Top performers
-        report.append("TOP PERFORMERS BY CATEGORY")
-        report.append("-" * 40)
+        print("TOP PERFORMERS BY CATEGORY", file=buf)
+        print("-" * 40, file=buf)
 
         if data['rankings']['overall']:
-            report.append("\n🏆 Overall Score:")
+            print("\n🏆 Overall Score:", file=buf)
             for i, item in enumerate(data['rankings']['overall'][:5], 1):
-                report.append(f"  {i}. {item['mlip']}: {item['score']:.3f} ({item['num_datasets']} datasets)")
+                print(f"  {i}. {item['mlip']}: {item['score']:.3f} ({item['num_datasets']} datasets)", file=buf)
 
         if data['rankings']['accuracy']:
-            report.append("\n🎯 Best Accuracy (MAE):")
+            print("\n🎯 Best Accuracy (MAE):", file=buf)
             for i, item in enumerate(data['rankings']['accuracy'][:5], 1):
-                report.append(f"  {i}. {item['mlip']}: {item['mae']:.3f} ± {item['std']:.3f} eV")
+                print(f"  {i}. {item['mlip']}: {item['mae']:.3f} ± {item['std']:.3f} eV", file=buf)
 
         if data['rankings']['success_rate']:
-            report.append("\n✅ Highest Success Rate:")
+            print("\n✅ Highest Success Rate:", file=buf)
             for i, item in enumerate(data['rankings']['success_rate'][:5], 1):
-                report.append(f"  {i}. {item['mlip']}: {item['rate']:.1f} ± {item['std']:.1f}%")
+                print(f"  {i}. {item['mlip']}: {item['rate']:.1f} ± {item['std']:.1f}%", file=buf)
 
         if data['rankings']['speed']:
-            report.append("\n⚡ Fastest Models:")
+            print("\n⚡ Fastest Models:", file=buf)
             for i, item in enumerate(data['rankings']['speed'][:5], 1):
-                report.append(f"  {i}. {item['mlip']}: {item['time']:.4f} ± {item['std']:.4f} s/step")
+                print(f"  {i}. {item['mlip']}: {item['time']:.4f} ± {item['std']:.4f} s/step", file=buf)
 
         if data['rankings']['coverage']:
-            report.append("\n📊 Best Coverage:")
+            print("\n📊 Best Coverage:", file=buf)
             for i, item in enumerate(data['rankings']['coverage'][:5], 1):
-                report.append(f"  {i}. {item['mlip']}: {item['count']} datasets")
+                print(f"  {i}. {item['mlip']}: {item['count']} datasets", file=buf)
+
+        print("\n" + "=" * 80, file=buf)
 
-        report.append("\n" + "=" * 80)
+        # print() ends every line with a newline; the report file has none after the last line
+        text = buf.getvalue()[:-1]
 
         # Save report
         report_path = self.output_dir / 'summary_report.txt'
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(report))
+        report_path.write_text(text, encoding='utf-8')
 
         print(f"  ✅ Saved report to {report_path}")
 
         # Also print to console
-        print("\n" + '\n'.join(report))
+        sys.stdout.write("\n" + text + "\n")
 
     def run(self):
         """Run the complete leaderboard generation process."""
@@ -150,7 +150,7 @@ export function getAdsorbateBreakdown(jsonData, mlipName) {
 
 /**
  * Retrieve adsorbate-level metrics for a specific MLIP within a specific dataset.
- * @param {Object} jsonData - leaderboard_data.json payload
+ * @param {Object} jsonData - leaderboard_data.json payload, with the dataset's sheet file merged into excel_data
  * @param {string} datasetName - dataset name
  * @param {string} mlipName - MLIP identifier
  * @returns {Array} adsorbate rows